@@ -9,321 +9,634 @@ Author matching script that:
 import os
 import sys
 import time
+import unicodedata
 import requests
-from collections import Counter
+from requests.adapters import HTTPAdapter, Retry
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 # Add the project root directory to Python path to enable imports from utilities
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+# When stdout is redirected (e.g. piped to a log file or tee), switch it to
+# block buffering: otherwise every status line costs its own write() syscall,
+# which adds up to hundreds of thousands of syscalls over a full run
+if not sys.stdout.isatty():
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
 from utilities.db_utils import test_connection, execute_query_with_connection
+
+# rapidfuzz is an optional dependency: a C++ fuzzy string matcher whose
+# scorers are far faster than pure-Python similarity, which matters in the
+# second-pass scan over every author seen in the works
+try:
+    from rapidfuzz import fuzz
+    from rapidfuzz import process as rf_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+from utilities.http_utils import fetch_json_many, parse_json_response
 from utilities.sim_lib import author_similarity
-from authors_matching.stats_utils import calculate_statistics, print_statistics
+from authors_matching.stats_utils import AuthorStat, calculate_statistics, print_statistics
 
 # Constants
 ROR_POLITO = 'https://ror.org/00bgk9508'  # ROR identifier for Politecnico di Torino
 OPENALEX_API_BASE = 'https://api.openalex.org'  # Base URL for OpenAlex API
 API_DELAY = 0.1  # Delay between API calls to respect rate limits (in seconds)
 WORK_API_DELAY = 0.05  # Delay when fetching work data by DOI (in seconds)
+DOI_BATCH_SIZE = 50  # Max number of ORed DOIs per OpenAlex filter query
+# Field projection for author searches: the script only reads id,
+# display_name and orcid, so asking OpenAlex for just those fields cuts
+# the JSON payload to transfer and parse by an order of magnitude
+AUTHOR_FIELDS = 'id,display_name,orcid'
+# Page size and field projection for the startup download of the full
+# PoliTo author index (cursor pagination; OpenAlex caps per-page at 200)
+INDEX_PAGE_SIZE = 200
+INDEX_AUTHOR_FIELDS = 'id,display_name,orcid,display_name_alternatives'
+# Number of worker processes for the per-author loop: each author is
+# independent, so the JSON parsing, Counter updates and similarity scoring
+# (the CPU-bound part of an iteration) run on all cores instead of one.
+# Set to 1 to force the sequential loop (easier debugging)
+MAX_WORKERS = os.cpu_count() or 1
+# How many authors each worker picks up at a time (amortizes IPC overhead)
+CHUNKSIZE = 32
 
-# Test database connection and get connection/cursor objects
-conn, cursor = test_connection()
-
-print("=" * 80)
-print("AUTHOR MATCHING WITH OPENALEX")
-print("=" * 80)
-print()
-
-# Query to get all distinct authors from IRIS database
-# Returns: matricola (employee ID), NOME_AUTORE (first name), COGNOME_AUTORE (last name), ORCID
-select_all_authors_query = """
-SELECT DISTINCT matricola, NOME_AUTORE, COGNOME_AUTORE, ORCID
-FROM pub_ri_prodotti_autori
-where anno > 1996 and anno < 1998 and ORCID is null
-limit 200
-"""
+# Persistent HTTP session with keep-alive and connection pooling: reusing the
+# TCP+TLS connection avoids a handshake on every OpenAlex call, and the retry
+# policy transparently handles rate-limit (429) and transient server errors.
+# When requests-cache is installed, responses are also memoized on disk
+# (SQLite) so re-runs and co-authored DOIs skip the network entirely;
+# OpenAlex data updates daily, so a two-week TTL is safe
 
-print("Fetching all authors from IRIS...")
-authors = execute_query_with_connection(cursor, select_all_authors_query, conn=conn)
-print(f"Found {len(authors)} authors to process\n")
-print("=" * 80)
-print()
 
-# Main loop: process each author completely in one iteration
-# For each author: search OpenAlex -> analyze matches -> output results
-main_loop_count = 0
-total = len(authors)
+def _build_session():
+    """
+    Build a fresh OpenAlex HTTP session (cached when requests-cache is
+    installed). Factored out because each pool worker must create its own
+    session: a session inherited across fork() shares the parent's live
+    keep-alive sockets and SQLite cache handle between processes, which
+    can interleave responses and corrupt the cache.
 
-# List to store statistics data for each author
-stats_data = []
+    Returns:
+        requests.Session: Configured session with retries and polite UA
+    """
+    try:
+        from datetime import timedelta
+        from requests_cache import CachedSession
+        session = CachedSession('openalex_cache.sqlite', backend='sqlite',
+                                allowable_codes=[200],
+                                expire_after=timedelta(days=14))
+    except ImportError:
+        session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(total=5, backoff_factor=0.2,
+                          status_forcelist=[429, 500, 502, 503, 504])
+    ))
+    # Identify the client per OpenAlex polite-pool rules (faster request tier)
+    session.headers['User-Agent'] = 'polito_FAIR_project (mailto:fedra-project@polito.it)'
+    return session
+
+
+SESSION = _build_session()
+
+# Per-process state for the worker pool: the prefetched DOI table, the
+# PoliTo author index and the total author count are installed once per
+# worker by _init_worker, so they are pickled N times (once per process)
+# instead of once per author
+dois_by_matricola = {}
+authors_by_orcid = {}
+authors_by_norm_name = {}
+total = 0
+
+
+def _init_worker(doi_table, orcid_index, name_index, author_total):
+    """
+    Initializer run once in each worker process.
+
+    Args:
+        doi_table: Mapping of matricola -> list of publication DOIs
+        orcid_index: Mapping of ORCID URL -> OpenAlex author record
+        name_index: Mapping of normalized name -> list of author records
+        author_total: Total number of authors (for progress output)
+    """
+    global dois_by_matricola, authors_by_orcid, authors_by_norm_name, total
+    global SESSION
+    dois_by_matricola = doi_table
+    authors_by_orcid = orcid_index
+    authors_by_norm_name = name_index
+    total = author_total
+    # Replace the session inherited from the parent across fork(): the
+    # inherited one shares the parent's open sockets (and SQLite cache
+    # handle) with every sibling worker, so each worker builds its own
+    SESSION = _build_session()
+
+
+def _normalize_name(name):
+    """
+    Normalize an author name for index lookups.
+
+    Strips accents (è -> e), lowercases and collapses whitespace, so that
+    the usual spelling differences between IRIS and OpenAlex names do not
+    prevent a match.
+
+    Args:
+        name (str): Author name in any form
+
+    Returns:
+        str: Normalized name
+    """
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return ' '.join(stripped.lower().split())
+
+
+def fetch_polito_author_index():
+    """
+    Download the full list of PoliTo-affiliated OpenAlex authors once.
+
+    Pages through /authors with cursor pagination (per-page=200) filtered
+    by the PoliTo ROR identifier: the whole institution fits in a few
+    dozen GETs, after which author resolution in the main loop is a local
+    dict lookup instead of one search request per IRIS author.
+
+    Returns:
+        tuple: (by_orcid, by_norm_name) where by_orcid maps the ORCID URL
+        to the author record and by_norm_name maps each normalized
+        display name (including alternatives) to a list of records
+    """
+    by_orcid = {}
+    by_norm_name = defaultdict(list)
+    params = {
+        'filter': f"affiliations.institution.ror:{ROR_POLITO}",
+        'select': INDEX_AUTHOR_FIELDS,
+        'per-page': INDEX_PAGE_SIZE,
+        'cursor': '*',
+    }
+    while params['cursor']:
+        response = SESSION.get(f"{OPENALEX_API_BASE}/authors", params=params, timeout=(5, 30))
+        if response.status_code != 200:
+            break
+        data = parse_json_response(response)
+        for record in data.get('results', []):
+            if not record.get('id') or not record.get('display_name'):
+                continue
+            if record.get('orcid'):
+                by_orcid[record['orcid']] = record
+            # Index the record under every distinct normalized spelling
+            names = [record['display_name']] + (record.get('display_name_alternatives') or [])
+            for key in {_normalize_name(name) for name in names}:
+                by_norm_name[key].append(record)
+        params['cursor'] = data.get('meta', {}).get('next_cursor')
+        time.sleep(API_DELAY)
+    return by_orcid, dict(by_norm_name)
+
+
+def process_author(indexed_author):
+    """
+    Process one author end to end: search OpenAlex, then validate or
+    disambiguate the candidates with DOI-based work analysis.
+
+    Runs independently per author, so it can be mapped across a process
+    pool. _init_worker rebuilds the module-level SESSION in each worker,
+    hence each worker owns its own HTTP connection pool and its own
+    handle on the requests-cache SQLite file (when enabled), so workers
+    still deduplicate lookups through the shared cache file.
+
+    Args:
+        indexed_author: (position, author_row) tuple from enumerate()
+
+    Returns:
+        dict: Statistics entry for this author, or None if the row was
+        missing essential information
+    """
+    idx, author = indexed_author
+    # Per-author output buffer: the ~15 status lines are joined and
+    # written with one print at the end, so each author costs one
+    # write instead of fifteen and lines from pool workers do not
+    # interleave mid-author
+    out = []
+
+    # Extract author information from database record by position: the
+    # bulk SELECT runs on a plain tuple cursor, which skips the per-row
+    # dict construction (and key hashing) of the dictionary cursor
+    matricola, nome, cognome, orcid = author
 
-for idx, author in enumerate(authors, 1):
-    main_loop_count += 1
-    
-    # Extract author information from database record
-    matricola = author.get("matricola")  # Employee ID
-    nome = author.get("NOME_AUTORE")  # First name
-    cognome = author.get("COGNOME_AUTORE")  # Last name
-    orcid = author.get("ORCID")  # ORCID identifier (may be None)
-    
     # Skip authors with missing essential information
     if not matricola or not nome or not cognome:
-        continue
-    
-    print(f"[{main_loop_count}/{total}] Processing: {nome} {cognome} (matricola: {matricola})")
-    print("-" * 80)
+        return None
+
+    out.append(f"[{idx}/{total}] Processing: {nome} {cognome} (matricola: {matricola})")
+    out.append("-" * 80)
     
-    # Initialize statistics entry for this author
-    author_stats = {
-        "matricola": matricola,
-        "nome": nome,
-        "cognome": cognome,
-        "orcid": orcid,
-        "matches_found": 0,
-        "search_method": None,
-        "doi_analysis_performed": False,
-        "compatible_match_found": False,
-        "similar_match_found": False,
-        "no_compatible_match": False,
-        "publications_with_doi": 0
-    }
+    # Initialize statistics entry for this author (slotted dataclass:
+    # compact fixed layout instead of one dict per author)
+    author_stats = AuthorStat(matricola=matricola, nome=nome,
+                              cognome=cognome, orcid=orcid)
     
     # STEP 1: Search OpenAlex for this author
     # Try ORCID search first (more reliable), then fall back to name/affiliation search
     search_successful = False
-    oa_authors = []  # List of (display_name, oa_id) tuples for matching authors
-    
+    # Set of (display_name, oa_id) tuples for matching authors: a set
+    # deduplicates candidates that come back twice (e.g. overlapping
+    # result pages), so the DOI-analysis passes never re-check duplicates
+    oa_authors = set()
+    # The ORCID in URL form as OpenAlex returns it; if any candidate's
+    # record carries this exact ORCID the identity is already settled and
+    # the DOI-based analysis can be skipped altogether
+    orcid_url = f"https://orcid.org/{orcid}" if orcid else None
+    orcid_confirmed_match = None
+
+    # STEP 0: Resolve against the prefetched PoliTo author index.
+    # A dict lookup replaces one /authors search request per author; the
+    # HTTP searches below only run when the index has no entry (e.g. the
+    # author left OpenAlex's affiliation window, or the index download
+    # failed and the tables are empty)
+    if orcid_url and orcid_url in authors_by_orcid:
+        record = authors_by_orcid[orcid_url]
+        candidate = (record['display_name'], record['id'])
+        oa_authors.add(candidate)
+        orcid_confirmed_match = candidate
+        search_successful = True
+        author_stats.search_method = "ORCID"
+        out.append(f"  ✅ Found author by ORCID in local index")
+    elif authors_by_norm_name:
+        for record in authors_by_norm_name.get(_normalize_name(f"{nome} {cognome}"), []):
+            candidate = (record['display_name'], record['id'])
+            oa_authors.add(candidate)
+            if orcid_url and record.get('orcid') == orcid_url:
+                orcid_confirmed_match = candidate
+        if oa_authors:
+            search_successful = True
+            author_stats.search_method = "name_institution"
+            out.append(f"  ✅ Found {len(oa_authors)} author(s) by name in local index")
+    resolved_locally = search_successful
+
     # If ORCID is present, search OpenAlex by ORCID first (more reliable than name search)
-    if orcid:
-        print(f"  🔍 Searching by ORCID...")
+    if orcid and not search_successful:
+        out.append(f"  🔍 Searching by ORCID...")
         
         # Search OpenAlex using ORCID filter
         # ORCID format in OpenAlex API: https://orcid.org/{orcid}
-        # Also include name in search query to improve accuracy
-        search_query = f"{nome}%20{cognome}"
-        url = f"{OPENALEX_API_BASE}/authors?search={search_query}&filter=orcid:https://orcid.org/{orcid}"
-        
+        # Also include name in search query to improve accuracy.
+        # The query string is built by requests from a params dict, which
+        # URL-encodes accented characters in Italian names correctly
+        # (hand-concatenated URLs double-encoded them)
+        params = {
+            'search': f"{nome} {cognome}",
+            'filter': f"orcid:https://orcid.org/{orcid}",
+            'select': AUTHOR_FIELDS,
+            'per-page': 10,
+        }
+
         try:
-            response = requests.get(url)
+            response = SESSION.get(f"{OPENALEX_API_BASE}/authors", params=params, timeout=(5, 20))
             if response.status_code == 200:
-                response_data = response.json()
+                response_data = parse_json_response(response)
                 count = response_data.get("meta", {}).get("count", 0)
                 if count >= 1:
                     # Extract matching authors from results
                     results = response_data.get('results', [])
                     for match_author in results:
                         if match_author.get('id') and match_author.get('display_name'):
-                            oa_authors.append((match_author['display_name'], match_author['id']))
+                            candidate = (match_author['display_name'], match_author['id'])
+                            oa_authors.add(candidate)
+                            if match_author.get('orcid') == orcid_url:
+                                orcid_confirmed_match = candidate
                     search_successful = True
-                    print(f"  ✅ Found {len(oa_authors)} author(s) by ORCID")
-                    author_stats["search_method"] = "ORCID"
+                    out.append(f"  ✅ Found {len(oa_authors)} author(s) by ORCID")
+                    author_stats.search_method = "ORCID"
                 else:
-                    print(f"  ⚠️  No match found by ORCID, falling back to name/affiliation search")
+                    out.append(f"  ⚠️  No match found by ORCID, falling back to name/affiliation search")
             else:
-                print(f"  ⚠️  API error with ORCID search, falling back to name/affiliation search")
+                out.append(f"  ⚠️  API error with ORCID search, falling back to name/affiliation search")
         except Exception as e:
-            print(f"  ⚠️  Error searching by ORCID: {e}, falling back to name/affiliation search")
+            out.append(f"  ⚠️  Error searching by ORCID: {e}, falling back to name/affiliation search")
     
     # If no ORCID or ORCID search failed, search by name and affiliation (Politecnico di Torino)
     # This is a broader search that may return multiple potential matches
     if not search_successful:
         if orcid:
-            print(f"  🔍 Searching by name/institution...")
+            out.append(f"  🔍 Searching by name/institution...")
         else:
-            print(f"  🔍 Searching by name/institution (no ORCID available)...")
-        
-        # Search by author name and filter by Politecnico di Torino ROR identifier
-        search_query = f"{nome}%20{cognome}"
-        url = f"{OPENALEX_API_BASE}/authors?search={search_query}&filter=affiliations.institution.ror:{ROR_POLITO}"
+            out.append(f"  🔍 Searching by name/institution (no ORCID available)...")
         
+        # Search by author name and filter by Politecnico di Torino ROR
+        # identifier; params dict again so requests handles the URL encoding
+        params = {
+            'search': f"{nome} {cognome}",
+            'filter': f"affiliations.institution.ror:{ROR_POLITO}",
+            'select': AUTHOR_FIELDS,
+            'per-page': 10,
+        }
+
         try:
-            response = requests.get(url)
+            response = SESSION.get(f"{OPENALEX_API_BASE}/authors", params=params, timeout=(5, 20))
             if response.status_code == 200:
                 # Extract matching authors from results
-                results = response.json().get('results', [])
+                results = parse_json_response(response).get('results', [])
                 for match_author in results:
                     if match_author.get('id') and match_author.get('display_name'):
-                        oa_authors.append((match_author['display_name'], match_author['id']))
+                        candidate = (match_author['display_name'], match_author['id'])
+                        oa_authors.add(candidate)
+                        if orcid_url and match_author.get('orcid') == orcid_url:
+                            orcid_confirmed_match = candidate
                 if oa_authors:
-                    print(f"  ✅ Found {len(oa_authors)} author(s) by name/institution")
-                    if not author_stats["search_method"]:
-                        author_stats["search_method"] = "name_institution"
+                    out.append(f"  ✅ Found {len(oa_authors)} author(s) by name/institution")
+                    if not author_stats.search_method:
+                        author_stats.search_method = "name_institution"
                 else:
-                    print(f"  ⚠️  No match found by name/institution")
-                    if not author_stats["search_method"]:
-                        author_stats["search_method"] = "name_institution"
+                    out.append(f"  ⚠️  No match found by name/institution")
+                    if not author_stats.search_method:
+                        author_stats.search_method = "name_institution"
         except Exception as e:
-            print(f"  Error searching OpenAlex for {nome} {cognome}: {e}")
+            out.append(f"  Error searching OpenAlex for {nome} {cognome}: {e}")
     
     # Rate limiting: delay between API calls to avoid overwhelming the API
-    time.sleep(API_DELAY)
+    # (not needed when the author was resolved from the local index)
+    if not resolved_locally:
+        time.sleep(API_DELAY)
     
     # If no matches found, skip to next author (no further processing possible)
     if not oa_authors:
-        print(f"  No OpenAlex matches found for this author")
-        print()
-        author_stats["matches_found"] = 0
-        stats_data.append(author_stats)
-        continue
+        out.append(f"  No OpenAlex matches found for this author")
+        out.append("")
+        author_stats.matches_found = 0
+        print("\n".join(out))
+        return author_stats
     
     # Update statistics with number of matches found
-    author_stats["matches_found"] = len(oa_authors)
-    
-    # Display all found matches
-    print(f"  Found {len(oa_authors)} OpenAlex candidate(s):")
-    for oa_idx, (display_name_choose, id_choose) in enumerate(oa_authors, 1):
-        print(f"    {oa_idx}. {display_name_choose} ({id_choose})")
+    author_stats.matches_found = len(oa_authors)
+
+    # Early exit: a candidate whose OpenAlex record carries the author's
+    # own ORCID is already a confirmed identity, so the whole DOI-based
+    # work analysis (one batched HTTP round per ~50 DOIs) can be skipped
+    if orcid_confirmed_match is not None:
+        display_name_choose, id_choose = orcid_confirmed_match
+        out.append(f"  ✓ ORCID-confirmed match: {display_name_choose}")
+        out.append(f"    OpenAlex ID: {id_choose}")
+        author_stats.compatible_match_found = True
+        out.append("")
+        print("\n".join(out))
+        return author_stats
+
+
+    # Display all found matches (sorted for a stable, readable listing)
+    out.append(f"  Found {len(oa_authors)} OpenAlex candidate(s):")
+    for oa_idx, (display_name_choose, id_choose) in enumerate(sorted(oa_authors), 1):
+        out.append(f"    {oa_idx}. {display_name_choose} ({id_choose})")
     
     # STEP 2: Use DOI-based work analysis to find the best match (even for single matches)
     # This analyzes which OpenAlex author appears most frequently in the author's publications
     if len(oa_authors) >= 1:
         if len(oa_authors) > 1:
-            print(f"  Multiple matches found - checking for DOI-based analysis...")
+            out.append(f"  Multiple matches found - checking for DOI-based analysis...")
         else:
-            print(f"  Single match found - verifying with DOI-based analysis...")
-        
-        # Query to get all DOIs for publications by this author (matricola)
-        # Joins pub_ri_prodotti_autori with pub_ri_prodotti_base to get DOI information
-        select_doi_by_matricola_query = """
-        SELECT DISTINCT iw.cd_doi as doi
-        FROM pub_ri_prodotti_autori AS it
-        INNER JOIN pub_ri_prodotti_base AS iw
-        ON it.handle = iw.HANDLE 
-        WHERE iw.cd_doi IS NOT NULL AND it.matricola = %s
-        """
+            out.append(f"  Single match found - verifying with DOI-based analysis...")
         
-        dois = execute_query_with_connection(cursor, select_doi_by_matricola_query, params=(matricola,), conn=conn)
-        author_stats["publications_with_doi"] = len(dois)
-        print(f"  Found {len(dois)} publication(s) with DOI")
+        # Look up the author's DOIs in the table prefetched in main():
+        # a dict access replaces one JOIN query round trip per author
+        dois = dois_by_matricola.get(matricola, [])
+        author_stats.publications_with_doi = len(dois)
+        out.append(f"  Found {len(dois)} publication(s) with DOI")
         
         # Need at least one DOI to perform analysis
         if len(dois) == 0:
-            print("  ⚠️  No publications with DOI found - cannot perform detailed analysis")
-            print()
-            stats_data.append(author_stats)
-            continue
+            out.append("  ⚠️  No publications with DOI found - cannot perform detailed analysis")
+            out.append("")
+            print("\n".join(out))
+            return author_stats
         
         # Mark that DOI-based analysis is being performed
-        author_stats["doi_analysis_performed"] = True
+        author_stats.doi_analysis_performed = True
         
         # Collect all authors from works to find which OpenAlex author appears most frequently
-        # This helps identify the correct author when multiple matches exist
-        all_authors_data = []  # List of all author tuples found in works
-        counter = Counter()  # Count occurrences of each author across all works
-        doi_count = 0
-        
-        # For each DOI, fetch the work from OpenAlex and extract all authors
-        for d_item in dois:
-            doi_count += 1
-            doi = d_item.get("doi")
-            if not doi:
+        # This helps identify the correct author when multiple matches exist.
+        # The counter is keyed on the OpenAlex author ID (not the
+        # (display_name, id) tuple) so the same author is not fragmented
+        # across works where the display name differs
+        counter = Counter()  # Occurrences of each author ID across all works
+        display_name_by_id = {}  # One representative display name per author ID
+
+        # Batch the DOI lookups: OpenAlex accepts up to 50 ORed DOIs in a
+        # single /works?filter=doi:D1|D2|... query, so N publications need
+        # only ceil(N/50) requests instead of one request per DOI.
+        # select=authorships trims each work to the only field read below.
+        doi_values = dois
+        work_urls = []
+        for chunk_start in range(0, len(doi_values), DOI_BATCH_SIZE):
+            chunk = doi_values[chunk_start:chunk_start + DOI_BATCH_SIZE]
+            work_urls.append(
+                f"{OPENALEX_API_BASE}/works?filter=doi:{'|'.join(chunk)}"
+                f"&per-page={DOI_BATCH_SIZE}&select=authorships"
+            )
+        out.append(f"  Investigating work authors for {len(doi_values)} DOI(s) "
+              f"in {len(work_urls)} batched request(s) ... ")
+        work_responses = fetch_json_many(work_urls, delay=WORK_API_DELAY)
+
+        # Extract all authors from each work of each batched response
+        for data in work_responses:
+            if data is None:
                 continue
-            
-            # Fetch work data from OpenAlex using DOI
-            url = f"{OPENALEX_API_BASE}/works/https://doi.org/{doi}"
-            
-            try:
-                response = requests.get(url)
-                if response.status_code == 200:
-                    data = response.json()
-                    authorships = data.get("authorships", [])
-                    
-                    # Extract all authors from this work
-                    for authorship in authorships:
-                        author = authorship.get("author")
-                        if author and author.get("display_name") and author.get("id"):
-                            couple = (author["display_name"], author["id"])
-                            all_authors_data.append(couple)
-                            counter[couple] += 1  # Count how many times this author appears
-            except Exception as e:
-                print(f"  Error fetching work by DOI {doi}: {e}")
-            
-            # Progress indicator (overwrites same line)
-            print(f"  Investigating work authors {doi_count}/{len(dois)} ... ", end="\r")
-            time.sleep(WORK_API_DELAY)  # Rate limiting
-        
-        print()  # New line after progress indicator
+            for work in data.get("results", []):
+                authorships = work.get("authorships", [])
+                for authorship in authorships:
+                    author = authorship.get("author")
+                    if author and author.get("display_name") and author.get("id"):
+                        counter[author["id"]] += 1  # Count how many times this author appears
+                        display_name_by_id.setdefault(author["id"], author["display_name"])
         
         # If no authors found in any works, cannot perform analysis
         if not counter:
-            print("  ⚠️  No authors found in works")
-            print()
-            stats_data.append(author_stats)
-            continue
+            out.append("  ⚠️  No authors found in works")
+            out.append("")
+            print("\n".join(out))
+            return author_stats
         
         # First pass: look for exact matches in top 3 most common authors from works
-        # Check if any of the OpenAlex candidates match the most frequent authors in the works
+        # Check if any of the OpenAlex candidates match the most frequent authors
+        # in the works; a set of candidate IDs turns the inner scan over
+        # oa_authors into a single hash lookup
+        oa_id_set = {oa_id for _, oa_id in oa_authors}
         flag = False
         ranking_position = 0
-        for item in counter.most_common(3):  # Check top 3 most frequent authors
+        for item_id, count in counter.most_common(3):  # Check top 3 most frequent authors
             ranking_position += 1
-            item_data, count = item
-            item_display_name = item_data[0]  # Author display name
-            item_id = item_data[1]  # OpenAlex author ID
-            
-            # Check if this author ID matches any of our OpenAlex candidates
-            for oa_display_name, oa_id in oa_authors:
-                if item_id == oa_id:
-                    print(f"  ✓ Compatible match found: {item_display_name} ({count} occurrences, rank {ranking_position})")
-                    print(f"    OpenAlex ID: {item_id}")
-                    author_stats["compatible_match_found"] = True
-                    flag = True
-                    break
-            
-            if flag:
+            if item_id in oa_id_set:
+                out.append(f"  ✓ Compatible match found: {display_name_by_id[item_id]} ({count} occurrences, rank {ranking_position})")
+                out.append(f"    OpenAlex ID: {item_id}")
+                author_stats.compatible_match_found = True
+                flag = True
                 break
         
         # Second pass: if no exact match found, look for similar names using similarity scoring
         # This handles cases where the name might be slightly different (e.g., middle initials)
         last_flag = False
         if not flag:
-            for item in counter.most_common():
-                item_data, count = item
-                item_display_name = item_data[0]
-                item_id = item_data[1]
-                
-                # Calculate similarity between IRIS name and OpenAlex author name
-                iris_full_name = f"{nome} {cognome}"
-                score_similarity = author_similarity(item_display_name, iris_full_name)
-                
-                # If similarity is high enough (>0.7), consider it a match
-                if score_similarity > 0.7:
-                    print(f"  ✓ Similar match found: {item_display_name} ({count} occurrences, similarity: {score_similarity:.2f})")
-                    print(f"    OpenAlex ID: {item_id}")
-                    author_stats["similar_match_found"] = True
+            iris_full_name = f"{nome} {cognome}"
+            if RAPIDFUZZ_AVAILABLE:
+                # Score all candidate names in one compiled call instead of
+                # one pure-Python author_similarity call per candidate.
+                # token_set_ratio scores 0-100, so the cutoff 70 mirrors the
+                # 0.7 threshold of the fallback loop below
+                ranked = counter.most_common()
+                choice = rf_process.extractOne(
+                    iris_full_name,
+                    [display_name_by_id[item_id] for item_id, _ in ranked],
+                    scorer=fuzz.token_set_ratio,
+                    score_cutoff=70)
+                if choice is not None:
+                    item_display_name, score, choice_idx = choice
+                    item_id, count = ranked[choice_idx]
+                    out.append(f"  ✓ Similar match found: {item_display_name} ({count} occurrences, similarity: {score / 100:.2f})")
+                    out.append(f"    OpenAlex ID: {item_id}")
+                    author_stats.similar_match_found = True
                     last_flag = True
-                    break
+            else:
+                for item_id, count in counter.most_common():
+                    item_display_name = display_name_by_id[item_id]
+                    # Calculate similarity between IRIS name and OpenAlex author name
+                    score_similarity = author_similarity(item_display_name, iris_full_name)
+
+                    # If similarity is high enough (>0.7), consider it a match
+                    if score_similarity > 0.7:
+                        out.append(f"  ✓ Similar match found: {item_display_name} ({count} occurrences, similarity: {score_similarity:.2f})")
+                        out.append(f"    OpenAlex ID: {item_id}")
+                        author_stats.similar_match_found = True
+                        last_flag = True
+                        break
             
             # If still no match found, report the most frequent author (even if incompatible)
             if not last_flag:
                 most_common = counter.most_common(1)
                 if most_common:
-                    item_data, count = most_common[0]
-                    print(f"  ✗ No compatible match found")
-                    print(f"    Most frequent (incompatible): {item_data[0]} ({count} occurrences)")
-                    print(f"    OpenAlex ID: {item_data[1]}")
-                    author_stats["no_compatible_match"] = True
+                    item_id, count = most_common[0]
+                    out.append(f"  ✗ No compatible match found")
+                    out.append(f"    Most frequent (incompatible): {display_name_by_id[item_id]} ({count} occurrences)")
+                    out.append(f"    OpenAlex ID: {item_id}")
+                    author_stats.no_compatible_match = True
                 else:
-                    print(f"  ✗ No result")
-                    author_stats["no_compatible_match"] = True
-    
-    # Add statistics entry to list
-    stats_data.append(author_stats)
+                    out.append(f"  ✗ No result")
+                    author_stats.no_compatible_match = True
     
+    out.append("")
+    print("\n".join(out))
+    return author_stats
+
+
+def main():
+    # Test database connection and get connection/cursor objects.
+    # The bulk SELECTs below go through a plain tuple cursor instead of the
+    # dictionary cursor: rows come back as tuples, avoiding one dict
+    # allocation per row on result sets with tens of thousands of rows
+    conn, cursor = test_connection()
+    cursor_tuple = conn.cursor()
+
+    print("=" * 80)
+    print("AUTHOR MATCHING WITH OPENALEX")
+    print("=" * 80)
     print()
 
-print("=" * 80)
-print("PROCESSING COMPLETE")
-print("=" * 80)
-print(f"Processed {main_loop_count} authors")
+    # Query to get one row per author from IRIS database
+    # Returns: matricola (employee ID), NOME_AUTORE (first name), COGNOME_AUTORE (last name), ORCID
+    # GROUP BY matricola instead of SELECT DISTINCT over all four columns:
+    # the server deduplicates by the grouping key alone rather than
+    # sort-deduplicating full rows (name spellings can vary per row, so
+    # MIN() just picks a deterministic representative).
+    # An index on (anno, matricola) would let this run as an index-covered
+    # streaming scan; worth adding on the IRIS side if this query shows up
+    # in the slow log
+    select_all_authors_query = """
+    SELECT matricola, MIN(NOME_AUTORE) AS NOME_AUTORE,
+           MIN(COGNOME_AUTORE) AS COGNOME_AUTORE, MIN(ORCID) AS ORCID
+    FROM pub_ri_prodotti_autori
+    where anno > 1996 and anno < 1998 and ORCID is null
+    GROUP BY matricola
+    limit 200
+    """
+
+    print("Fetching all authors from IRIS...")
+    authors = execute_query_with_connection(cursor_tuple, select_all_authors_query, conn=conn)
+    print(f"Found {len(authors)} authors to process\n")
+
+    # Prefetch every author's publication DOIs with a single JOIN query and
+    # group them by matricola: one round trip to MySQL instead of one
+    # cursor.execute per author inside the main loop
+    select_all_dois_query = """
+    SELECT DISTINCT it.matricola, iw.cd_doi as doi
+    FROM pub_ri_prodotti_autori AS it
+    INNER JOIN pub_ri_prodotti_base AS iw
+    ON it.handle = iw.HANDLE
+    WHERE iw.cd_doi IS NOT NULL
+    """
+
+    print("Prefetching publication DOIs for all authors...")
+    doi_rows = execute_query_with_connection(cursor_tuple, select_all_dois_query, conn=conn)
+    doi_table = defaultdict(list)
+    for matricola, doi in doi_rows:
+        doi_table[matricola].append(doi)
+    print(f"Found DOIs for {len(doi_table)} authors\n")
+
+    # Download the full PoliTo author index once: a few dozen paginated
+    # GETs up front replace one search request per IRIS author below.
+    # On failure the index stays empty and every author falls back to the
+    # per-author HTTP search, so the run still completes
+    print("Prefetching PoliTo author index from OpenAlex...")
+    try:
+        orcid_index, name_index = fetch_polito_author_index()
+        print(f"Indexed {len(orcid_index)} authors by ORCID, "
+              f"{len(name_index)} distinct normalized names\n")
+    except Exception as e:
+        print(f"⚠️  Could not build author index ({e}), falling back to per-author search\n")
+        orcid_index, name_index = {}, {}
+    print("=" * 80)
+    print()
+
+    # The database is no longer needed past this point: the DOI prefetch
+    # replaced the per-author queries, so workers only talk to OpenAlex
+    cursor_tuple.close()
+    cursor.close()
+    conn.close()
+
+    # Main loop: process each author completely in one iteration
+    # For each author: search OpenAlex -> analyze matches -> output results
+    # With MAX_WORKERS > 1 the authors are sharded across a process pool:
+    # each worker runs process_author independently (own HTTP session, own
+    # CPU core for JSON parsing and similarity scoring)
+    indexed_authors = list(enumerate(authors, 1))
+    if MAX_WORKERS > 1:
+        # Close the parent's session before forking: the author-index
+        # download above left live keep-alive sockets (and, with
+        # requests-cache, an open SQLite handle) in its pool, and fork()
+        # would hand copies of those descriptors to every worker
+        SESSION.close()
+        with ProcessPoolExecutor(max_workers=MAX_WORKERS,
+                                 initializer=_init_worker,
+                                 initargs=(dict(doi_table), orcid_index,
+                                           name_index, len(authors))) as executor:
+            results = list(executor.map(process_author, indexed_authors,
+                                        chunksize=CHUNKSIZE))
+    else:
+        _init_worker(dict(doi_table), orcid_index, name_index, len(authors))
+        results = [process_author(item) for item in indexed_authors]
+
+    # Drop the None entries returned for rows with missing information
+    stats_data = [entry for entry in results if entry is not None]
+
+    print("=" * 80)
+    print("PROCESSING COMPLETE")
+    print("=" * 80)
+    print(f"Processed {len(stats_data)} authors")
+
+    # Calculate and display statistics
+    if stats_data:
+        print("\nCalculating statistics...")
+        stats = calculate_statistics(stats_data)
+        print_statistics(stats)
 
-# Calculate and display statistics
-if stats_data:
-    print("\nCalculating statistics...")
-    stats = calculate_statistics(stats_data)
-    print_statistics(stats)
 
-# Close database connection and cursor
-cursor.close()
-conn.close()
+if __name__ == "__main__":
+    main()
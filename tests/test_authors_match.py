@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Smoke test for authors_matching.authors_match.process_author.
+
+Guards the control flow of the DOI-based analysis: an author that has
+DOIs must actually reach the work-analysis match passes (a mis-indented
+return once made that whole section dead code), and an author without
+DOIs must stop at the early-exit guard. Network and database access are
+stubbed out, so the test runs without credentials or connectivity.
+
+Run with:  python -m unittest tests.test_authors_match
+"""
+
+import io
+import os
+import sys
+import types
+import unittest
+from contextlib import redirect_stdout
+
+# Add the project root directory to Python path to enable imports from
+# the package directories (same pattern as the scripts themselves)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+
+def _install_stub_modules():
+    """
+    Install minimal stand-ins for third-party modules that the script
+    imports at module level but that this test never exercises (requests
+    for HTTP, mysql.connector for the database). Real installations are
+    left untouched: a stub is only registered when the import fails.
+    """
+    try:
+        import requests  # noqa: F401
+    except ImportError:
+        requests_mod = types.ModuleType('requests')
+
+        class _StubSession:
+            def __init__(self):
+                self.headers = {}
+
+            def mount(self, prefix, adapter):
+                pass
+
+            def get(self, *args, **kwargs):
+                raise AssertionError('unexpected HTTP request in smoke test')
+
+            def close(self):
+                pass
+
+        adapters_mod = types.ModuleType('requests.adapters')
+        adapters_mod.HTTPAdapter = lambda *args, **kwargs: None
+        adapters_mod.Retry = lambda *args, **kwargs: None
+        requests_mod.Session = _StubSession
+        requests_mod.RequestException = Exception
+        requests_mod.adapters = adapters_mod
+        requests_mod.get = _StubSession().get
+        sys.modules['requests'] = requests_mod
+        sys.modules['requests.adapters'] = adapters_mod
+
+    try:
+        import mysql.connector  # noqa: F401
+    except ImportError:
+        mysql_mod = types.ModuleType('mysql')
+        connector_mod = types.ModuleType('mysql.connector')
+        connector_mod.Error = Exception
+        connector_mod.errorcode = types.SimpleNamespace()
+        connector_mod.pooling = types.SimpleNamespace()
+        mysql_mod.connector = connector_mod
+        sys.modules['mysql'] = mysql_mod
+        sys.modules['mysql.connector'] = connector_mod
+
+
+_install_stub_modules()
+
+from authors_matching import authors_match  # noqa: E402
+
+
+# Fixture: one PoliTo author known to the local index, with two DOIs
+MATRICOLA = '012345'
+NOME = 'Maria'
+COGNOME = 'Rossi'
+OA_ID = 'https://openalex.org/A5000000001'
+DOIS = ['10.1000/test.1', '10.1000/test.2']
+
+
+def _fake_fetch_json_many(urls, **kwargs):
+    """Batched /works response: the indexed candidate authored both works."""
+    return [{
+        'results': [
+            {'authorships': [{'author': {'id': OA_ID,
+                                         'display_name': 'Maria Rossi'}}]}
+            for _ in DOIS
+        ]
+    }]
+
+
+class ProcessAuthorSmokeTest(unittest.TestCase):
+
+    def setUp(self):
+        # Install the worker globals exactly as the process pool would,
+        # resolving the author from the local name index so process_author
+        # makes no author-search HTTP request
+        record = {'display_name': 'Maria Rossi', 'id': OA_ID, 'orcid': None}
+        name_key = authors_match._normalize_name(f"{NOME} {COGNOME}")
+        authors_match._init_worker(
+            {MATRICOLA: DOIS},  # doi_table
+            {},                 # orcid_index
+            {name_key: [record]},  # name_index
+            1,                  # author_total
+        )
+        self._real_fetch = authors_match.fetch_json_many
+        authors_match.fetch_json_many = _fake_fetch_json_many
+
+    def tearDown(self):
+        authors_match.fetch_json_many = self._real_fetch
+
+    def test_author_with_dois_reaches_match_passes(self):
+        """An author with DOIs must run the DOI-based work analysis."""
+        with redirect_stdout(io.StringIO()):
+            stats = authors_match.process_author(
+                (1, (MATRICOLA, NOME, COGNOME, None)))
+        self.assertIsNotNone(stats)
+        self.assertEqual(stats.matches_found, 1)
+        self.assertEqual(stats.publications_with_doi, len(DOIS))
+        # The core regression check: the analysis actually ran and the
+        # exact-match pass confirmed the candidate against the works
+        self.assertTrue(stats.doi_analysis_performed)
+        self.assertTrue(stats.compatible_match_found)
+
+    def test_author_without_dois_stops_at_guard(self):
+        """Without DOIs the analysis is skipped via the early return."""
+        authors_match.dois_by_matricola = {}
+        with redirect_stdout(io.StringIO()):
+            stats = authors_match.process_author(
+                (1, (MATRICOLA, NOME, COGNOME, None)))
+        self.assertIsNotNone(stats)
+        self.assertEqual(stats.publications_with_doi, 0)
+        self.assertFalse(stats.doi_analysis_performed)
+
+
+if __name__ == '__main__':
+    unittest.main()
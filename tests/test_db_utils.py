@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the .env parsing in utilities.db_utils.
+
+Pin _parse_env_text to line-safe behavior: an empty assignment ("KEY=")
+must not swallow the next line's entry, and a line without '=' must be
+skipped instead of being merged into the following key. Both failure
+modes would lose or corrupt a DB credential.
+
+Run with:  python -m unittest tests.test_db_utils
+"""
+
+import os
+import sys
+import types
+import unittest
+
+# Add the project root directory to Python path to enable imports from
+# the package directories (same pattern as the scripts themselves)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+
+def _install_stub_modules():
+    """
+    Install a minimal stand-in for mysql.connector, which db_utils
+    imports at module level but this test never exercises. A stub is
+    only registered when the real import fails.
+    """
+    try:
+        import mysql.connector  # noqa: F401
+    except ImportError:
+        mysql_mod = types.ModuleType('mysql')
+        connector_mod = types.ModuleType('mysql.connector')
+        connector_mod.Error = Exception
+        connector_mod.errorcode = types.SimpleNamespace()
+        connector_mod.pooling = types.SimpleNamespace()
+        mysql_mod.connector = connector_mod
+        sys.modules['mysql'] = mysql_mod
+        sys.modules['mysql.connector'] = connector_mod
+
+
+_install_stub_modules()
+
+from utilities.db_utils import _parse_env_text  # noqa: E402
+
+
+class ParseEnvTextTest(unittest.TestCase):
+
+    def test_basic_assignments(self):
+        text = 'user=admin\npassword=  s3cret \nhost="db.local"\ndatabase=\'fair\''
+        self.assertEqual(_parse_env_text(text),
+                         {'user': 'admin', 'password': 's3cret',
+                          'host': 'db.local', 'database': 'fair'})
+
+    def test_empty_assignment_does_not_swallow_next_line(self):
+        # "k5=" must yield an empty value; the whitespace after '=' must
+        # not cross the newline and absorb the k6 entry
+        text = 'k5=\nk6="x" trailing'
+        self.assertEqual(_parse_env_text(text),
+                         {'k5': '', 'k6': '"x" trailing'})
+
+    def test_line_without_equals_is_skipped(self):
+        # "nokey" has no '=' and must be dropped, not merged into the
+        # following line's key
+        text = 'nokey\nk=v'
+        self.assertEqual(_parse_env_text(text), {'k': 'v'})
+
+    def test_comments_and_blank_lines_skipped(self):
+        text = '# comment\n\n  key = value  \n'
+        self.assertEqual(_parse_env_text(text), {'key': 'value'})
+
+    def test_quotes_stripped_only_when_matched_on_both_sides(self):
+        text = 'a="unterminated\nb=" spaced "\nc=\'it\'\'s\''
+        self.assertEqual(_parse_env_text(text),
+                         {'a': '"unterminated', 'b': ' spaced ',
+                          'c': "it''s"})
+
+    def test_value_may_contain_equals(self):
+        self.assertEqual(_parse_env_text('x=a=b=c'), {'x': 'a=b=c'})
+
+    def test_crlf_line_endings(self):
+        self.assertEqual(_parse_env_text('crlf=val\r\nnext=2'),
+                         {'crlf': 'val', 'next': '2'})
+
+
+if __name__ == '__main__':
+    unittest.main()
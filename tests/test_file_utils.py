@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the author-string parsers in utilities.file_utils.
+
+Pin the regex-based parse_author_pairs to the behavior of the original
+split-based parser, edge cases included: a trailing comma keeps the
+surname with an empty given name, and whitespace-only segments yield no
+author at all.
+
+Run with:  python -m unittest tests.test_file_utils
+"""
+
+import os
+import sys
+import unittest
+
+# Add the project root directory to Python path to enable imports from
+# the package directories (same pattern as the scripts themselves)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utilities.file_utils import parse_author_pairs, parse_author_pairs_batch  # noqa: E402
+
+
+class ParseAuthorPairsTest(unittest.TestCase):
+
+    def test_surname_name_pairs(self):
+        self.assertEqual(parse_author_pairs('Rossi, Maria; Bianchi, Luca'),
+                         ['Maria Rossi', 'Luca Bianchi'])
+
+    def test_bare_name_kept_as_is(self):
+        # No comma: the entry is returned as-is (with the trailing space
+        # of the original "{nome} {cognome}" formatting, cognome empty)
+        self.assertEqual(parse_author_pairs('Rossi'), ['Rossi '])
+
+    def test_trailing_comma_keeps_surname(self):
+        # "Rossi," has a comma and an empty given name: the surname must
+        # survive, formatted as "{nome} {cognome}" with nome empty
+        self.assertEqual(parse_author_pairs('Rossi,'), [' Rossi'])
+
+    def test_whitespace_only_segments_yield_no_author(self):
+        self.assertEqual(parse_author_pairs('; ;'), [])
+        self.assertEqual(parse_author_pairs('   '), [])
+        self.assertEqual(parse_author_pairs(''), [])
+
+    def test_mixed_entries(self):
+        self.assertEqual(parse_author_pairs('Rossi, Maria; ; Bianchi,'),
+                         ['Maria Rossi', ' Bianchi'])
+
+    def test_whitespace_stripped_around_parts(self):
+        self.assertEqual(parse_author_pairs(' De Rossi , Gian Maria ; Verdi '),
+                         ['Gian Maria De Rossi', 'Verdi '])
+
+    def test_batch_matches_single(self):
+        strings = ['Rossi, Maria; Bianchi, Luca', 'Rossi,', '; ;', 'Verdi']
+        self.assertEqual(parse_author_pairs_batch(strings),
+                         [parse_author_pairs(s) for s in strings])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,16 +4,62 @@ Database utility functions for MySQL operations
 """
 
 import mysql.connector
-from mysql.connector import Error, errorcode
+from mysql.connector import Error, errorcode, pooling
 import os
+import re
 from pathlib import Path
 
+# One key=value assignment per line; value may be double-quoted,
+# single-quoted or bare. Compiled once so load_env_file is a single
+# finditer pass over the file instead of several string operations per
+# line, and quotes are only stripped when they match on both sides.
+# Only [ \t] (never \s) is allowed around '=' and newlines are excluded
+# from the key and value classes, so an empty assignment ("KEY=") or a
+# line without '=' can never swallow the following line's entry
+_ENV_LINE = re.compile(
+    r"""^[ \t]*([^#=\s][^=\n]*?)[ \t]*=[ \t]*(?:"([^\n]*)"|'([^\n]*)'|([^\n]*?))[ \t]*\r?$""",
+    re.MULTILINE)
+
+# Shared connection pool for the one-shot helpers (execute_query,
+# execute_insert, execute_insert_many): without it every call paid a full
+# TCP + authentication handshake (~10-50 ms) to open and then close its
+# own connection. Created lazily on first use so merely importing this
+# module does not require database credentials
+_POOL = None
+_POOL_SIZE = 8
+
+
+def _parse_env_text(text):
+    """
+    Parse the text of a .env file into a dict.
+
+    Empty lines, comment lines and lines without '=' simply do not match
+    the pattern and are skipped.
+
+    Args:
+        text (str): Full content of a .env file
+
+    Returns:
+        dict: Dictionary containing environment variables
+    """
+    env_vars = {}
+    for match in _ENV_LINE.finditer(text):
+        key, double_quoted, single_quoted, bare = match.groups()
+        if double_quoted is not None:
+            value = double_quoted
+        elif single_quoted is not None:
+            value = single_quoted
+        else:
+            value = bare
+        env_vars[key] = value
+    return env_vars
+
 
 def load_env_file():
     """
     Load environment variables from .env file.
     Looks for .env file in the project root directory.
-    
+
     Returns:
         dict: Dictionary containing environment variables
     """
@@ -21,27 +67,9 @@ def load_env_file():
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
     env_file = project_root / '.env'
-    
-    env_vars = {}
-    
+
     if env_file.exists():
-        with open(env_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-                # Split on first '=' sign
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    env_vars[key] = value
+        env_vars = _parse_env_text(env_file.read_text(encoding='utf-8'))
     else:
         # Fallback to system environment variables if .env doesn't exist
         env_vars = {
@@ -79,6 +107,36 @@ def get_db_connection():
         raise mysql.connector.Error(f"Errore di connessione: {err}")
 
 
+def get_pooled_connection():
+    """
+    Return a connection from the shared pool, creating the pool on first use.
+    Closing the returned connection gives it back to the pool instead of
+    tearing down the TCP session.
+
+    Returns:
+        mysql.connector.pooling.PooledMySQLConnection: Pooled connection
+
+    Raises:
+        mysql.connector.Error: If the pool cannot be created
+    """
+    global _POOL
+    if _POOL is None:
+        env = load_env_file()
+        config = {
+            'user': env['user'],
+            'password': env['password'],
+            'host': env['host'],
+            'database': env['database'],
+        }
+        try:
+            _POOL = pooling.MySQLConnectionPool(pool_name='polito_fair',
+                                                pool_size=_POOL_SIZE,
+                                                **config)
+        except mysql.connector.Error as err:
+            raise mysql.connector.Error(f"Errore di connessione: {err}")
+    return _POOL.get_connection()
+
+
 def test_connection():
     """
     Test database connection and return connection and cursor objects.
@@ -106,11 +164,12 @@ def execute_query(query, params=None):
         
     Returns:
         list: List of dictionaries containing query results
-        
+
     Raises:
         mysql.connector.Error: If query execution fails
     """
-    conn, cursor = test_connection()
+    conn = get_pooled_connection()
+    cursor = conn.cursor(dictionary=True)
     try:
         if params:
             cursor.execute(query, params)
@@ -139,7 +198,8 @@ def execute_insert(query, params):
     Raises:
         mysql.connector.Error: If insert execution fails
     """
-    conn, cursor = test_connection()
+    conn = get_pooled_connection()
+    cursor = conn.cursor(dictionary=True)
     try:
         cursor.execute(query, params)
         conn.commit()
@@ -167,7 +227,8 @@ def execute_insert_many(query, params_list):
     Raises:
         mysql.connector.Error: If batch insert execution fails
     """
-    conn, cursor = test_connection()
+    conn = get_pooled_connection()
+    cursor = conn.cursor(dictionary=True)
     try:
         cursor.executemany(query, params_list)
         conn.commit()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Utilities for working with a local OpenAlex data dump (snapshot).
+
+OpenAlex recommends the fortnightly full data dump over the REST API for
+bulk workloads (above ~100k queries/day). These helpers stream the
+gzipped JSONL snapshot files for the `authors` and `works` entities from
+a local directory, so bulk matching can filter and index everything
+locally instead of issuing one HTTP request per author/DOI.
+
+Expected layout (as downloaded from the OpenAlex S3 bucket):
+
+    <snapshot_dir>/authors/updated_date=*/part_*.gz
+    <snapshot_dir>/works/updated_date=*/part_*.gz
+
+Each part file contains one JSON document per line.
+"""
+
+import gzip
+import json
+from pathlib import Path
+
+
+def iter_snapshot_records(snapshot_dir, entity):
+    """
+    Stream all records of an entity from a local OpenAlex snapshot.
+
+    Args:
+        snapshot_dir (str or Path): Root directory of the snapshot
+        entity (str): Entity name, e.g. 'authors' or 'works'
+
+    Yields:
+        dict: One parsed JSON record at a time (constant memory)
+    """
+    entity_dir = Path(snapshot_dir) / entity
+    for part_file in sorted(entity_dir.glob('**/*.gz')):
+        with gzip.open(part_file, 'rt', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+
+def build_author_indexes(snapshot_dir, ror):
+    """
+    Build local lookup indexes for the authors of one institution.
+
+    Scans the `authors` entity once, keeps only authors affiliated with
+    the given ROR identifier, and returns two dictionaries so author
+    resolution becomes a local lookup instead of an API search.
+
+    Args:
+        snapshot_dir (str or Path): Root directory of the snapshot
+        ror (str): ROR identifier of the institution (full URL form)
+
+    Returns:
+        tuple: (by_orcid, by_name) where by_orcid maps the ORCID URL to
+        the author record and by_name maps the lowercased display name
+        to a list of author records (homonyms possible)
+    """
+    by_orcid = {}
+    by_name = {}
+    for author in iter_snapshot_records(snapshot_dir, 'authors'):
+        affiliations = author.get('affiliations') or []
+        if not any((a.get('institution') or {}).get('ror') == ror for a in affiliations):
+            continue
+        orcid = author.get('orcid')
+        if orcid:
+            by_orcid[orcid] = author
+        display_name = author.get('display_name')
+        if display_name:
+            by_name.setdefault(display_name.lower(), []).append(author)
+    return by_orcid, by_name
+
+
+def collect_work_authorships(snapshot_dir, dois):
+    """
+    Collect the authorships of the works matching a set of DOIs.
+
+    Scans the `works` entity once and returns, for each requested DOI,
+    the list of (display_name, id) author tuples of that work — the same
+    shape the DOI-based disambiguation in authors_match.py consumes.
+
+    Args:
+        snapshot_dir (str or Path): Root directory of the snapshot
+        dois (iterable): DOIs to look up (with or without the
+            https://doi.org/ prefix, case-insensitive)
+
+    Returns:
+        dict: Mapping of normalized DOI -> list of (display_name, id) tuples
+    """
+    wanted = {_normalize_doi(d) for d in dois if d}
+    found = {}
+    for work in iter_snapshot_records(snapshot_dir, 'works'):
+        doi = _normalize_doi(work.get('doi'))
+        if doi not in wanted:
+            continue
+        authors = []
+        for authorship in work.get('authorships', []):
+            author = authorship.get('author')
+            if author and author.get('display_name') and author.get('id'):
+                authors.append((author['display_name'], author['id']))
+        found[doi] = authors
+        # Stop scanning once every requested DOI has been found
+        if len(found) == len(wanted):
+            break
+    return found
+
+
+def _normalize_doi(doi):
+    """
+    Normalize a DOI for comparison (strip the URL prefix, lowercase).
+
+    Args:
+        doi (str or None): DOI in any common form
+
+    Returns:
+        str or None: Normalized DOI, or None if input was falsy
+    """
+    if not doi:
+        return None
+    doi = doi.lower()
+    if doi.startswith('https://doi.org/'):
+        doi = doi[len('https://doi.org/'):]
+    return doi
@@ -6,6 +6,7 @@ then compares the coverage to identify missing works on each platform.
 """
 
 PRINT_NOT_MATCHED_WORKS = False  # If True, print titles of works not matched
+VERBOSE = True  # If False, print only a one-line progress summary per author
 SAVE_RESULTS_TO_FILE = True  # If True, save results to JSON file
 EXTRACT_STATS_ONLY = False  # If True, load results from file and extract statistics without processing
 RESULTS_FILE_PATH = None  # Path to results file (if None, will look for most recent oa_vs_scopus_results_*.txt)
@@ -14,11 +15,13 @@ import os
 import sys
 import time
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import re
 import math
 from datetime import datetime
 from collections import defaultdict
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 # Add the project root directory to Python path to enable imports from utilities
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -26,382 +29,632 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from utilities.db_utils import test_connection, execute_query_with_connection
-from utilities.file_utils import write_json_to_file, read_json_from_file
-from utilities.sim_lib import similarity_titles, author_similarity
+from utilities.file_utils import FileUtilError, write_json_to_file, read_json_from_file
+from utilities.http_utils import fetch_json_many
+from utilities.sim_lib import author_similarity, title_match_exists
 from works_coverage.coverage_stats_utils import extract_statistics
 import glob
 
+# rapidfuzz is optional: its C++ scorers replace the pure-Python title scans
+# below when installed, and the sim_lib implementations are used otherwise
+try:
+    from rapidfuzz import fuzz
+    from rapidfuzz import process as rf_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 # ROR identifier for Politecnico di Torino
 ROR_POLITO = 'https://ror.org/00bgk9508'
 
-# Check if we should only extract statistics from file
-if EXTRACT_STATS_ONLY:
-    # Find the results file to load
-    if RESULTS_FILE_PATH and os.path.exists(RESULTS_FILE_PATH):
-        results_file = RESULTS_FILE_PATH
-    elif RESULTS_FILE_PATH:
-        print(f"❌ Error: Specified results file not found: {RESULTS_FILE_PATH}")
-        exit(1)
+# Scopus Author IDs are 10-11 digit numbers, sometimes wrapped in extra text
+# in IRIS records. Compiled once at module scope instead of inside the
+# per-author loop
+SCOPUS_ID_RE = re.compile(r'(\d{10,11})')
+
+# Maximum number of DOIs OpenAlex accepts in a single OR-filter
+DOI_BATCH_SIZE = 50
+
+# Pool sizing for the per-author workers (mirrors authors_match): the work is
+# dominated by OpenAlex round trips, so one worker per core overlaps the I/O
+MAX_WORKERS = os.cpu_count() or 1
+CHUNKSIZE = 8
+
+# HTTP session shared by every OpenAlex call in this script. When
+# requests-cache is installed, responses — the per-author DOI batches in
+# particular — persist on disk with a TTL, so re-runs over the same authors
+# skip the network for unchanged works; otherwise a plain session still
+# reuses connections. Mirrors the setup in authors_match.
+
+
+def _build_session():
+    """
+    Build a fresh OpenAlex HTTP session (cached when requests-cache is
+    installed). Factored out because each pool worker must create its own
+    session: one inherited across fork() shares the parent's live
+    keep-alive sockets and SQLite cache handle between processes.
+
+    Returns:
+        requests.Session: Configured session with retries and polite UA
+    """
+    try:
+        from datetime import timedelta
+        from requests_cache import CachedSession
+        session = CachedSession('openalex_coverage_cache.sqlite', backend='sqlite',
+                                allowable_codes=[200],
+                                expire_after=timedelta(days=14))
+    except ImportError:
+        session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(total=5, backoff_factor=0.2,
+                          status_forcelist=[429, 500, 502, 503, 504])
+    ))
+    # Identify the client per OpenAlex polite-pool rules (faster request tier)
+    session.headers['User-Agent'] = 'polito_FAIR_project (mailto:fedra-project@polito.it)'
+    return session
+
+
+SESSION = _build_session()
+
+# Per-process state for the worker pool: the prefetched IRIS works and Scopus
+# tables, installed once per worker by _init_worker instead of being pickled
+# with every task
+iris_works_by_matricola = {}
+scopus_author_by_id = {}
+scopus_works_by_id = {}
+oa_work_by_iris_doi = {}
+total_authors = 0
+
+
+def _init_worker(iris_table, scopus_authors, scopus_works, oa_doi_table, author_total):
+    """
+    Install the prefetched lookup tables in a worker process.
+
+    Args:
+        iris_table: Dict matricola -> list of IRIS work dicts
+        scopus_authors: Dict AUTHORID -> {nome, cognome}
+        scopus_works: Dict AUTHORID -> list of {title, doi} dicts
+        oa_doi_table: Dict lowercased DOI -> OpenAlex work record
+        author_total: Total number of authors (for progress output)
+    """
+    global iris_works_by_matricola, scopus_author_by_id, scopus_works_by_id, oa_work_by_iris_doi, total_authors
+    global SESSION
+    iris_works_by_matricola = iris_table
+    scopus_author_by_id = scopus_authors
+    scopus_works_by_id = scopus_works
+    oa_work_by_iris_doi = oa_doi_table
+    total_authors = author_total
+    # Replace the session inherited from the parent across fork(): the
+    # inherited one shares the parent's open sockets (and SQLite cache
+    # handle) with every sibling worker, so each worker builds its own
+    SESSION = _build_session()
+
+
+def process_author(indexed_author):
+    """
+    Compare one author's IRIS works against OpenAlex and Scopus coverage.
+
+    All per-author output is buffered and printed in one call so lines from
+    concurrent workers do not interleave.
+
+    Args:
+        indexed_author: Tuple of (1-based progress index, author record dict)
+
+    Returns:
+        Result dict for the author when SAVE_RESULTS_TO_FILE is True,
+        otherwise None
+    """
+    idx, author_item = indexed_author
+    out = []  # Buffered output for this author, flushed once at the end
+
+    # Extract author information from IRIS
+    author_employee_id = author_item.get("matricola")  # Employee ID (matricola)
+    author_first_name = author_item.get("NOME_AUTORE")  # First name
+    author_last_name = author_item.get("COGNOME_AUTORE")  # Last name
+    author_orcid = author_item.get("ORCID")  # ORCID identifier
+    author_tax_code = author_item.get("COD_FIS")  # Tax code (codice fiscale)
+    author_role = author_item.get("POSIZIONE")  # Position/role
+    author_birth_year = author_item.get("BIRTH_DATE")  # Birth year
+    author_scopus_id = author_item.get("SCOPUS_ID")  # Scopus Author ID (e.g., 57213302418)
+    # Full name built once: the authorship checks below compare it against
+    # every candidate display name
+    author_full_name = f"{author_first_name} {author_last_name}"
+
+    # All works of the author, from the prefetched IRIS table
+    iris_works = iris_works_by_matricola.get(str(author_employee_id), [])
+    iris_works_with_doi = [work for work in iris_works if work.get("doi")]
+
+    out.append(f"*** 👤 AUTHOR {idx}/{total_authors} ***")
+    out.append(f"Employee ID: {author_employee_id}")
+    out.append(f"First Name: {author_first_name}")
+    out.append(f"Last Name: {author_last_name}")
+    out.append(f"Tax Code: {author_tax_code}")
+    out.append(f"Birth Year: {author_birth_year}")
+    out.append(f"Role: {author_role}")
+    out.append(f"Number of works: {len(iris_works)}")
+    out.append(f"Number of works with DOI: {len(iris_works_with_doi)}")
+
+    # Validate and extract Scopus Author ID
+    if not author_scopus_id:
+        out.append(f"🔴 Author without Scopus AuthorID")
     else:
-        # Look for the most recent results file
-        results_files = glob.glob("oa_vs_scopus_results_*.txt")
-        if not results_files:
-            print("❌ Error: No results files found (oa_vs_scopus_results_*.txt)")
-            print("   Please specify RESULTS_FILE_PATH or run the script with EXTRACT_STATS_ONLY = False")
-            exit(1)
-        # Sort by modification time and get the most recent
-        results_file = max(results_files, key=os.path.getmtime)
-    
-    print(f"📂 Loading results from: {results_file}")
-    all_results = read_json_from_file(results_file, cursor=None, conn=None)
-    print(f"✅ Loaded {len(all_results)} author results")
-    
-    # Extract and display statistics
-    extract_statistics(all_results)
-    
-    exit(0)
-
-# Test database connection and get connection/cursor objects
-conn, cursor = test_connection()
-
-# Query to retrieve authors from IRIS database
-# Starting from authors in iris_ods_l1_rm_person, find the employee ID (matricola) by matching
-# tax code (codice fiscale) with dwpauper_vista_personale_attivo and select all useful data
-# (first name, last name, Scopus ID, ORCID, etc.)
-distinct_author_query = """
-select iolrp.FIRST_NAME as NOME_AUTORE, iolrp.LAST_NAME as COGNOME_AUTORE, iolrp.ORCID as ORCID, 
-       iolrp.SCOPUS_ID as SCOPUS_ID, iolrp.CODICE_FISCALE as COD_FIS, dvpa.MATRICOLA as matricola, 
-       dvpa.POSIZIONE as POSIZIONE, YEAR(iolrp.BIRTH_DATE) as BIRTH_DATE
-from iris_ods_l1_rm_person iolrp 
-left join dwpauper_vista_personale_attivo dvpa on iolrp.CODICE_FISCALE = dvpa.COD_FISCALE 
-where dvpa.MATRICOLA is not null and iolrp.SCOPUS_ID is not null and YEAR(iolrp.BIRTH_DATE) > 1950
-"""
-
-# Execute query to retrieve authors from IRIS database
-results = execute_query_with_connection(cursor, distinct_author_query, conn=conn)
-
-authors_output_file = "all_anagrafe.txt"
-
-# Write query results to JSON file for processing
-write_json_to_file(results, authors_output_file, cursor=cursor, conn=conn)
-
-# Read the JSON file containing authors data
-authors = read_json_from_file(authors_output_file, cursor=cursor, conn=conn) 
-
-# List to store results for all authors
-all_results = []
-
-# Process all authors
-main_loop_count = 0
-print(f"\n")
-for author_item in authors:
-
-    main_loop_count += 1
-    # Skip authors before a certain index (can be modified to process specific ranges)
-    if main_loop_count > 0:
-        
-        # Extract author information from IRIS
-        author_employee_id = author_item.get("matricola")  # Employee ID (matricola)
-        author_first_name = author_item.get("NOME_AUTORE")  # First name
-        author_last_name = author_item.get("COGNOME_AUTORE")  # Last name
-        author_orcid = author_item.get("ORCID")  # ORCID identifier
-        author_tax_code = author_item.get("COD_FIS")  # Tax code (codice fiscale)
-        author_role = author_item.get("POSIZIONE")  # Position/role
-        author_birth_year = author_item.get("BIRTH_DATE")  # Birth year
-        author_scopus_id = author_item.get("SCOPUS_ID")  # Scopus Author ID (e.g., 57213302418)
-
-        # Query to retrieve all works of the author from IRIS
-        iris_works_query = f"""select prpb.TITOLO as titolo, prpb.cd_doi as doi, prpb.ANNO as anno, 
-                                   prpb.HANDLE as HANDLE, prpb.NOME_EDITORE as nome_editore, 
-                                   prpb.STRINGA_AUTORI as stringa_autori
-            from pub_ri_prodotti_autori as prpa 
-            join pub_ri_prodotti_base as prpb 
-            on prpa.ID_PRODOTTO = prpb.ID_PRODOTTO 
-            where prpa.matricola = {author_employee_id}"""
-
-        iris_works = execute_query_with_connection(cursor, iris_works_query, conn=conn)
-        iris_works_with_doi = [work for work in iris_works if work.get("doi")]
-
-        print(f"*** 👤 AUTHOR {main_loop_count}/{len(authors)} ***")
-        print(f"Employee ID: {author_employee_id}")
-        print(f"First Name: {author_first_name}")
-        print(f"Last Name: {author_last_name}")
-        print(f"Tax Code: {author_tax_code}")
-        print(f"Birth Year: {author_birth_year}")
-        print(f"Role: {author_role}")       
-        print(f"Number of works: {len(iris_works)}")
-        print(f"Number of works with DOI: {len(iris_works_with_doi)}")
-        
-        # Validate and extract Scopus Author ID
-        if not author_scopus_id:
-            print(f"🔴 Author without Scopus AuthorID")
+        match = SCOPUS_ID_RE.search(author_scopus_id)
+        if match:
+            author_scopus_id = match.group(1)
+            out.append(f"Scopus AuthorID: {author_scopus_id}")
         else:
-            match = re.search(r'(\d{10,11})', author_scopus_id)
-            if match:
-                author_scopus_id = match.group(1)
-                print(f"Scopus AuthorID: {author_scopus_id}")
-            else:
-                print(f"🔴 Invalid Scopus AuthorID: {author_scopus_id}")
-                author_scopus_id = None
-        
-
-        ### If author has ORCID, proceed with OpenAlex search
-        oa_works_count = 0                        
-        oa_matched_count = 0
-        oa_missing_iris_works = []
-        openalex_author_id_final = None
-        
-        if author_orcid is not None:
-            print(f"ORCID: {author_orcid}")
-            print(f"\n🅾️🅰️🔎 Searching for profile and works on OpenAlex using Name, Last Name and ORCID...")
-
-            # Search for author on OpenAlex using ORCID
-            orcid_search_url = f"https://api.openalex.org/authors?per-page=10&search={author_first_name}%20{author_last_name}&filter=orcid:https://orcid.org/{author_orcid}"
-            response = requests.get(orcid_search_url)
+            out.append(f"🔴 Invalid Scopus AuthorID: {author_scopus_id}")
+            author_scopus_id = None
+
+    ### If author has ORCID, proceed with OpenAlex search
+    oa_works_count = 0
+    oa_matched_count = 0
+    oa_missing_iris_works = []
+    openalex_author_id_final = None
+
+    if author_orcid is not None:
+        out.append(f"ORCID: {author_orcid}")
+        out.append(f"\n🅾️🅰️🔎 Searching for profile and works on OpenAlex using Name, Last Name and ORCID...")
+
+        # Search for author on OpenAlex using ORCID
+        orcid_search_url = f"https://api.openalex.org/authors?per-page=10&search={author_first_name}%20{author_last_name}&filter=orcid:https://orcid.org/{author_orcid}"
+        response = SESSION.get(orcid_search_url)
+
+        if response.status_code == 200:
+            response.raise_for_status()
+            oa_authors_results = response.json()
+            oa_search_count = oa_authors_results['meta']['count']
+            out.append(f"✅ Found {oa_search_count} OpenAlex profile(s)!")
+
+            if oa_search_count >= 1:
+                oa_works = []
+                first_author_found = True
+
+                # Process each OpenAlex profile found
+                for oa_author_profile in oa_authors_results['results']:
+                    openalex_author_id = oa_author_profile['id']
+                    openalex_display_name = oa_author_profile['display_name']
+                    out.append(f"✅ Found OpenAlex profile with ID = {openalex_author_id} and display_name = {openalex_display_name}!")
+
+                    # Extract OpenAlex ID (remove URL prefix without
+                    # building a throwaway split list)
+                    openalex_author_id_extracted = openalex_author_id.removeprefix("https://openalex.org/")
+                    if first_author_found:
+                        first_author_found = False
+                        openalex_author_id_final = openalex_author_id_extracted
+
+                    # Search for works by this author on OpenAlex
+                    per_page_number = 50
+                    page_number = 1
+                    works_by_id_search_url = f"https://api.openalex.org/works?per-page={per_page_number}&page={page_number}&filter=authorships.author.id:{openalex_author_id_extracted}"
+                    response = SESSION.get(works_by_id_search_url)
+
+                    # Retrieve OpenAlex works, page by page
+                    if response.status_code == 200:
+                        response.raise_for_status()
+                        page_oa_works = response.json()
+                        oa_works_count = page_oa_works['meta']['count']
+
+                        out.append(f"✅ Found {oa_works_count} works on OpenAlex!")
+
+                        # Save works from the first page
+                        for work in page_oa_works['results']:
+                            oa_works.append(work)
+
+                        # Retrieve and save works from remaining pages
+                        oa_pages_count = math.ceil(oa_works_count / per_page_number)
+                        for _ in range(2, oa_pages_count + 1):
+                            page_number += 1
+                            works_by_id_search_url = f"https://api.openalex.org/works?per-page={per_page_number}&page={page_number}&filter=authorships.author.id:{openalex_author_id_extracted}"
+                            response = SESSION.get(works_by_id_search_url)
+                            if response.status_code == 200:
+                                response.raise_for_status()
+                                page_oa_works = response.json()
+                                for work in page_oa_works['results']:
+                                    oa_works.append(work)
+                    else:
+                        out.append("❌ No works found on OpenAlex")
+
+                out.append(f"\n🔎 Comparing OpenAlex works with IRIS works...")
+                # Compare IRIS works with OpenAlex works
+                oa_matched_count = 0
+                oa_missing_iris_works = []
+                # Works that fail both local passes and need a title
+                # search: collected here and resolved in one concurrent
+                # batch after the loop instead of one blocking request each
+                pending_title_works = []
+
+                # Index the profile works by lowercased DOI once, so the
+                # DOI comparison is a dict lookup instead of re-splitting
+                # and lowercasing every OpenAlex DOI for every IRIS work
+                oa_by_doi = {}
+                for oa_work in oa_works:
+                    if oa_work.get("doi"):
+                        oa_by_doi[oa_work["doi"].removeprefix("https://doi.org/").lower()] = oa_work
+
+                # Candidate title list built once per author and shared by
+                # every IRIS work, instead of being rebuilt per comparison;
+                # sim_lib caches each title's token mask on first use
+                oa_titles = [oa_work.get("title") for oa_work in oa_works
+                             if oa_work.get("title") is not None]
 
-            if response.status_code == 200:
-                response.raise_for_status()
-                oa_authors_results = response.json()
-                oa_search_count = oa_authors_results['meta']['count']
-                print(f"✅ Found {oa_search_count} OpenAlex profile(s)!")
-
-                if oa_search_count >= 1:
-                    oa_works = []
-                    first_author_found = True
-                    
-                    # Process each OpenAlex profile found
-                    for oa_author_profile in oa_authors_results['results']:
-                        openalex_author_id = oa_author_profile['id']
-                        openalex_display_name = oa_author_profile['display_name']
-                        print(f"✅ Found OpenAlex profile with ID = {openalex_author_id} and display_name = {openalex_display_name}!")
-                        
-                        # Extract OpenAlex ID (remove URL prefix)
-                        openalex_author_id_extracted = openalex_author_id.split("https://openalex.org/")[1]
-                        if first_author_found:
-                            first_author_found = False
-                            openalex_author_id_final = openalex_author_id_extracted
-                        
-                        # Search for works by this author on OpenAlex
-                        per_page_number = 50
-                        page_number = 1
-                        works_by_id_search_url = f"https://api.openalex.org/works?per-page={per_page_number}&page={page_number}&filter=authorships.author.id:{openalex_author_id_extracted}"
-                        response = requests.get(works_by_id_search_url)
-
-                        # Retrieve OpenAlex works, page by page
-                        if response.status_code == 200:
-                            response.raise_for_status()
-                            page_oa_works = response.json()
-                            oa_works_count = page_oa_works['meta']['count']
-
-                            print(f"✅ Found {oa_works_count} works on OpenAlex!")
-                            
-                            # Save works from the first page
-                            for work in page_oa_works['results']:
-                                oa_works.append(work)
-
-                            # Retrieve and save works from remaining pages
-                            oa_pages_count = math.ceil(oa_works_count / per_page_number)
-                            for idx in range(2, oa_pages_count + 1):
-                                page_number += 1
-                                works_by_id_search_url = f"https://api.openalex.org/works?per-page={per_page_number}&page={page_number}&filter=authorships.author.id:{openalex_author_id_extracted}"
-                                response = requests.get(works_by_id_search_url)
-                                if response.status_code == 200:
-                                    response.raise_for_status()
-                                    page_oa_works = response.json()
-                                    for work in page_oa_works['results']:
-                                        oa_works.append(work)
-                        else:
-                            print("❌ No works found on OpenAlex")     
-
-                    print(f"\n🔎 Comparing OpenAlex works with IRIS works...")
-                    # Compare IRIS works with OpenAlex works
-                    oa_matched_count = 0
-                    oa_missing_iris_works = []
-                    
-                    for iris_work in iris_works:
+                for iris_work in iris_works:
+                    found_similarity = False
+                    # Normalize the IRIS fields once per work
+                    iris_doi = iris_work.get("doi")
+                    iris_doi = iris_doi.lower() if iris_doi else None
+                    iris_titolo = iris_work.get("titolo")
+
+                    # First, try an exact DOI hit in the indexed profile works
+                    if iris_doi is not None and iris_doi in oa_by_doi:
+                        oa_matched_count += 1
+                        found_similarity = True
+                    elif RAPIDFUZZ_AVAILABLE and iris_titolo is not None:
+                        # One C-level extractOne call with internal early
+                        # termination instead of the Python title scan
+                        if rf_process.extractOne(iris_titolo, oa_titles,
+                                                 scorer=fuzz.token_set_ratio,
+                                                 score_cutoff=50) is not None:
+                            oa_matched_count += 1
+                            found_similarity = True
+                    else:
+                        # Otherwise scan the profile titles by similarity;
+                        # title_match_exists skips candidates whose token
+                        # counts already rule out a >0.5 score and stops
+                        # at the first hit
+                        if title_match_exists(iris_titolo, oa_titles):
+                            oa_matched_count += 1
+                            found_similarity = True
+
+                    # If not found in author's profile, look up the shared
+                    # DOI table prefetched in main() instead of calling
+                    # the API
+                    if found_similarity == False:
+                        if iris_doi is not None:
+                            oa_work_by_doi = oa_work_by_iris_doi.get(iris_doi)
+                            if oa_work_by_doi is not None:
+                                # Check if author is in the work's authorships
+                                for oa_work_author in oa_work_by_doi['authorships']:
+                                    author_display_name = oa_work_author['author']['display_name']
+                                    if author_display_name is not None and author_similarity(
+                                        author_full_name,
+                                        author_display_name
+                                    ) > 0.5:
+                                        oa_matched_count += 1
+                                        found_similarity = True
+                                        break
+
+                        # If still not found, defer the title search to
+                        # the concurrent batch below
+                        if iris_titolo is not None and found_similarity is False:
+                            pending_title_works.append(iris_work)
+                            continue
+
+                    # If still not found, add to missing works list
+                    if found_similarity == False:
+                        oa_missing_iris_works.append(iris_titolo)
+
+                # Resolve all deferred title searches in one batch:
+                # fetch_json_many overlaps the requests with aiohttp when
+                # installed and falls back to a sequential loop otherwise
+                if pending_title_works:
+                    title_search_urls = [f"https://api.openalex.org/works?search={work.get('titolo')}"
+                                         for work in pending_title_works]
+                    title_responses = fetch_json_many(title_search_urls)
+                    for iris_work, oa_works_by_title in zip(pending_title_works, title_responses):
                         found_similarity = False
-                        
-                        # First, try to match with works already retrieved from author's profile
-                        for oa_work in oa_works:
-
-                            # Match by DOI
-                            if oa_work.get("doi") is not None and iris_work.get("doi") is not None:
-                                oa_doi = oa_work['doi'].split("https://doi.org/")[1].lower()
-                                iris_doi = iris_work.get("doi").lower()
-                                if oa_doi == iris_doi or similarity_titles(oa_doi, iris_doi) > 0.5:
-                                    oa_matched_count += 1
-                                    found_similarity = True
-                                    break
-
-                            # Match by title similarity
-                            if oa_work.get("title") is not None and iris_work.get("titolo") is not None:
-                                similarity_score = similarity_titles(iris_work.get("titolo"), oa_work.get("title"))
-                                if similarity_score > 0.5:
-                                    oa_matched_count += 1
-                                    found_similarity = True
-                                    break
-
-                        # If not found in author's profile, try searching by DOI
-                        if found_similarity == False:
-                            if iris_work.get("doi") is not None:
-                                work_by_doi_url = f"https://api.openalex.org/works?filter=doi:{iris_work.get('doi').lower()}"
-                                response = requests.get(work_by_doi_url)
-                                if response.status_code == 200:
-                                    response.raise_for_status()
-                                    oa_work_by_doi = response.json()
-                                    if oa_work_by_doi['meta']['count'] == 1:
-                                        # Check if author is in the work's authorships
-                                        for oa_work_author in oa_work_by_doi['results'][0]['authorships']:
-                                            author_display_name = oa_work_author['author']['display_name']
-                                            if author_display_name is not None and author_similarity(
-                                                f"{author_first_name} {author_last_name}", 
-                                                author_display_name
-                                            ) > 0.5:
-                                                oa_matched_count += 1
-                                                found_similarity = True
-                                                break
-
-                            # If still not found, try searching by title
-                            if iris_work.get("titolo") is not None and found_similarity is False:
-                                work_by_title_url = f"https://api.openalex.org/works?search={iris_work.get('titolo')}"
-                                response = requests.get(work_by_title_url)
-                                if response.status_code == 200:
-                                    response.raise_for_status()
-                                    oa_works_by_title = response.json()
-                                    if oa_works_by_title['meta']['count'] > 0:
-                                        for oa_work_by_title in oa_works_by_title['results']:
-                                            for oa_work_author in oa_work_by_title['authorships']:
-                                                author_display_name = oa_work_author['author']['display_name']
-                                                if (author_display_name is not None and 
-                                                    author_similarity(f"{author_first_name} {author_last_name}", 
-                                                                    author_display_name) > 0.5 and 
-                                                    found_similarity is False):
-                                                    oa_matched_count += 1    
-                                                    found_similarity = True
-                                                    break
+                        if oa_works_by_title is not None and oa_works_by_title['meta']['count'] > 0:
+                            for oa_work_by_title in oa_works_by_title['results']:
+                                for oa_work_author in oa_work_by_title['authorships']:
+                                    author_display_name = oa_work_author['author']['display_name']
+                                    if (author_display_name is not None and
+                                        author_similarity(author_full_name,
+                                                        author_display_name) > 0.5 and
+                                        found_similarity is False):
+                                        oa_matched_count += 1
+                                        found_similarity = True
+                                        break
 
                         # If still not found, add to missing works list
                         if found_similarity == False:
                             oa_missing_iris_works.append(iris_work.get("titolo"))
 
-                    print(f"👌 Works match: {oa_matched_count}/{len(iris_works)} (number of works matching on OpenAlex / total number of author's works)")
-                    if PRINT_NOT_MATCHED_WORKS:
-                        if (oa_matched_count < len(iris_works)):
-                            print(f"❌ Missing Works (title):")
-                            print(*[missing_work for missing_work in oa_missing_iris_works], sep='\n')
-                else:
-                    print("❌ No results found on OpenAlex")
+                out.append(f"👌 Works match: {oa_matched_count}/{len(iris_works)} (number of works matching on OpenAlex / total number of author's works)")
+                if PRINT_NOT_MATCHED_WORKS:
+                    if (oa_matched_count < len(iris_works)):
+                        out.append(f"❌ Missing Works (title):")
+                        out.extend(str(missing_work) for missing_work in oa_missing_iris_works)
             else:
-                print("❌ No results found on OpenAlex")
-                
+                out.append("❌ No results found on OpenAlex")
         else:
-            print(f"🔴 Author without ORCID")
-
-        ### If author has Scopus ID, proceed with Scopus search
-        scopus_works_count = 0                      
-        scopus_matched_count = 0
-        scopus_missing_iris_works = []
-        
-        if author_scopus_id is not None:
-            print(f"\n\n🔎 Searching for profile and works on Scopus...")
-
-            # Search for author in Scopus table using AuthorID
-            scopus_author_data_query = f"""select nome, cognome
-                from pub_scopus_articles_author 
-                where AUTHORID = {author_scopus_id}"""
-            scopus_author_data = execute_query_with_connection(cursor, scopus_author_data_query, conn=conn)
-            
-            if scopus_author_data:
-                scopus_author_data = scopus_author_data[0] 
-                print(f"✅ Found Scopus profile with ID = {author_scopus_id} and name = {scopus_author_data.get('nome')} {scopus_author_data.get('cognome')}!")
-                
-                # Query to retrieve all works of the author from Scopus
-                scopus_works_query = f"""select psa.TITLE as title, psa.DOI as doi
-                    from pub_scopus_articles_author psaa
-                    join pub_scopus_articles psa on psaa.PUBID = psa.PUBID
-                    where psaa.AUTHORID = {author_scopus_id}"""
-                scopus_works = execute_query_with_connection(cursor, scopus_works_query, conn=conn)
-                scopus_works_count = len(scopus_works)
-                
-                print(f"✅ Found {scopus_works_count} works on Scopus!")
-
-                print(f"\n🔎 Comparing Scopus works with IRIS works...")
-                # Compare IRIS works with Scopus works
-                scopus_matched_count = 0
-                scopus_missing_iris_works = []
-                
-                for iris_work in iris_works:
-                    found_similarity = False
+            out.append("❌ No results found on OpenAlex")
 
-                    for scopus_work in scopus_works:
-                        # Match by DOI
-                        if scopus_work.get("doi") is not None and iris_work.get("doi") is not None:
-                            if scopus_work.get("doi").lower() == iris_work.get("doi").lower():
-                                scopus_matched_count += 1
-                                found_similarity = True
-                                break
-
-                        # Match by title similarity
-                        if scopus_work.get("title") is not None:
-                            similarity_score = similarity_titles(iris_work.get("titolo"), scopus_work.get("title"))
-                            if similarity_score > 0.5:
-                                scopus_matched_count += 1
-                                found_similarity = True
-                                break
+    else:
+        out.append(f"🔴 Author without ORCID")
+
+    ### If author has Scopus ID, proceed with Scopus search
+    scopus_works_count = 0
+    scopus_matched_count = 0
+    scopus_missing_iris_works = []
+
+    if author_scopus_id is not None:
+        out.append(f"\n\n🔎 Searching for profile and works on Scopus...")
+
+        # Look up the author in the prefetched Scopus data
+        scopus_author_data = scopus_author_by_id.get(str(author_scopus_id))
+
+        if scopus_author_data:
+            out.append(f"✅ Found Scopus profile with ID = {author_scopus_id} and name = {scopus_author_data.get('nome')} {scopus_author_data.get('cognome')}!")
+
+            # All works of the author, from the prefetched IN-query
+            scopus_works = scopus_works_by_id.get(str(author_scopus_id), [])
+            scopus_works_count = len(scopus_works)
+
+            out.append(f"✅ Found {scopus_works_count} works on Scopus!")
+
+            out.append(f"\n🔎 Comparing Scopus works with IRIS works...")
+            # Compare IRIS works with Scopus works
+            scopus_matched_count = 0
+            scopus_missing_iris_works = []
+
+            # Index the Scopus works by lowercased DOI once, like the
+            # OpenAlex side above
+            scopus_by_doi = {}
+            for scopus_work in scopus_works:
+                if scopus_work.get("doi"):
+                    scopus_by_doi[scopus_work["doi"].lower()] = scopus_work
+
+            # Candidate title list built once per author, like the
+            # OpenAlex side above
+            scopus_titles = [scopus_work.get("title") for scopus_work in scopus_works
+                             if scopus_work.get("title") is not None]
+
+            for iris_work in iris_works:
+                found_similarity = False
+                # Normalize the IRIS fields once per work
+                iris_doi = iris_work.get("doi")
+                iris_doi = iris_doi.lower() if iris_doi else None
+                iris_titolo = iris_work.get("titolo")
+
+                # First, try an exact DOI hit in the indexed Scopus works
+                if iris_doi is not None and iris_doi in scopus_by_doi:
+                    scopus_matched_count += 1
+                    found_similarity = True
+                elif RAPIDFUZZ_AVAILABLE and iris_titolo is not None:
+                    # Same extractOne fast path as the OpenAlex side
+                    if rf_process.extractOne(iris_titolo, scopus_titles,
+                                             scorer=fuzz.token_set_ratio,
+                                             score_cutoff=50) is not None:
+                        scopus_matched_count += 1
+                        found_similarity = True
+                else:
+                    # Otherwise scan the Scopus titles by similarity, with
+                    # the same pre-filtered early-exit scan as the
+                    # OpenAlex side
+                    if title_match_exists(iris_titolo, scopus_titles):
+                        scopus_matched_count += 1
+                        found_similarity = True
+
+                if found_similarity == False:
+                    scopus_missing_iris_works.append(iris_titolo)
+
+            out.append(f"👌 Works match: {scopus_matched_count}/{len(iris_works)} (number of works matching on Scopus / total number of author's works)")
+            if PRINT_NOT_MATCHED_WORKS:
+                if (scopus_matched_count < len(iris_works)):
+                    out.append(f"❌ Missing Works (title):")
+                    out.extend(str(missing_work) for missing_work in scopus_missing_iris_works)
+        else:
+            out.append(f"❌ No results found on Scopus")
+
+    # Calculate works missing only on OpenAlex (present in Scopus but not
+    # in OpenAlex): one pass against a set of the Scopus misses instead of
+    # two O(n*m) list-membership scans
+    scopus_missing_set = set(scopus_missing_iris_works)
+    missing_only_on_oa_titles = [missing_work for missing_work in oa_missing_iris_works
+                                 if missing_work not in scopus_missing_set]
+    works_missing_only_on_oa = len(missing_only_on_oa_titles)
+    out.append(f"❌ {works_missing_only_on_oa} works missing only on OpenAlex (title):")
+    out.extend(str(missing_work) for missing_work in missing_only_on_oa_titles)
+
+    # Store results for this author
+    author_result = None
+    if SAVE_RESULTS_TO_FILE:
+        author_result = {
+            "matricola": author_employee_id,
+            "nome_autore": author_first_name,
+            "cognome_autore": author_last_name,
+            "cod_fis": author_tax_code,
+            "orcid": author_orcid,
+            "scopus_id": author_scopus_id,
+            "open_alex_id": openalex_author_id_final if openalex_author_id_final else None,
+            "numero_lavori": len(iris_works),
+            "numero_lavori_doi": len(iris_works_with_doi),
+            "oa_numero_lavori": oa_works_count,
+            "oa_match": oa_matched_count,
+            "scopus_numero_lavori": scopus_works_count,
+            "scopus_match": scopus_matched_count,
+            "lavori_mancanti_solo_su_oa": works_missing_only_on_oa,
+            "dt_ins": datetime.today().strftime('%Y-%m-%d')
+        }
+
+    # Flush this author's buffered output in one print; with VERBOSE off,
+    # only a one-line summary is written so hot runs skip the per-author
+    # detail I/O entirely
+    if VERBOSE:
+        out.append(f"\n\n\n")
+        print("\n".join(out))
+    else:
+        print(f"👤 AUTHOR {idx}/{total_authors}: {author_full_name} — OpenAlex match {oa_matched_count}/{len(iris_works)}, Scopus match {scopus_matched_count}/{len(iris_works)}")
+    return author_result
+
+
+def main():
+    # Check if we should only extract statistics from file
+    if EXTRACT_STATS_ONLY:
+        # Find the results file to load
+        if RESULTS_FILE_PATH and os.path.exists(RESULTS_FILE_PATH):
+            results_file = RESULTS_FILE_PATH
+        elif RESULTS_FILE_PATH:
+            print(f"❌ Error: Specified results file not found: {RESULTS_FILE_PATH}")
+            exit(1)
+        else:
+            # Look for the most recent results file
+            results_files = glob.glob("oa_vs_scopus_results_*.txt")
+            if not results_files:
+                print("❌ Error: No results files found (oa_vs_scopus_results_*.txt)")
+                print("   Please specify RESULTS_FILE_PATH or run the script with EXTRACT_STATS_ONLY = False")
+                exit(1)
+            # Sort by modification time and get the most recent
+            results_file = max(results_files, key=os.path.getmtime)
+
+        print(f"📂 Loading results from: {results_file}")
+        try:
+            all_results = read_json_from_file(results_file)
+        except FileUtilError as e:
+            print(e)
+            exit(1)
+        print(f"✅ Loaded {len(all_results)} author results")
+
+        # Extract and display statistics
+        extract_statistics(all_results)
+
+        exit(0)
+
+    # Test database connection and get connection/cursor objects
+    conn, cursor = test_connection()
+
+    # Query to retrieve authors from IRIS database
+    # Starting from authors in iris_ods_l1_rm_person, find the employee ID (matricola) by matching
+    # tax code (codice fiscale) with dwpauper_vista_personale_attivo and select all useful data
+    # (first name, last name, Scopus ID, ORCID, etc.)
+    distinct_author_query = """
+    select iolrp.FIRST_NAME as NOME_AUTORE, iolrp.LAST_NAME as COGNOME_AUTORE, iolrp.ORCID as ORCID,
+           iolrp.SCOPUS_ID as SCOPUS_ID, iolrp.CODICE_FISCALE as COD_FIS, dvpa.MATRICOLA as matricola,
+           dvpa.POSIZIONE as POSIZIONE, YEAR(iolrp.BIRTH_DATE) as BIRTH_DATE
+    from iris_ods_l1_rm_person iolrp
+    left join dwpauper_vista_personale_attivo dvpa on iolrp.CODICE_FISCALE = dvpa.COD_FISCALE
+    where dvpa.MATRICOLA is not null and iolrp.SCOPUS_ID is not null and YEAR(iolrp.BIRTH_DATE) > 1950
+    """
+
+    # Execute query to retrieve authors from IRIS database
+    results = execute_query_with_connection(cursor, distinct_author_query, conn=conn)
+
+    authors_output_file = "all_anagrafe.txt"
+
+    # Write query results to JSON file for processing, then read them back;
+    # on failure close the DB resources here (file_utils raises instead of
+    # exiting so callers own their cleanup)
+    try:
+        write_json_to_file(results, authors_output_file)
+        authors = read_json_from_file(authors_output_file)
+    except FileUtilError as e:
+        print(e)
+        cursor.close()
+        conn.close()
+        exit(1)
 
-                    if found_similarity == False:
-                        scopus_missing_iris_works.append(iris_work.get("titolo"))
+    # Prefetch all Scopus data with two parameterized IN-queries grouped by
+    # AUTHORID, instead of issuing two queries per author inside the main loop
+    valid_scopus_ids = set()
+    for author_item in authors:
+        raw_scopus_id = author_item.get("SCOPUS_ID")
+        if raw_scopus_id:
+            match = SCOPUS_ID_RE.search(raw_scopus_id)
+            if match:
+                valid_scopus_ids.add(match.group(1))
+
+    scopus_authors = {}               # AUTHORID -> {nome, cognome}
+    scopus_works = defaultdict(list)  # AUTHORID -> [{title, doi}, ...]
+    if valid_scopus_ids:
+        scopus_ids = tuple(valid_scopus_ids)
+        placeholders = ", ".join(["%s"] * len(scopus_ids))
+        scopus_author_data_query = f"""select AUTHORID, nome, cognome
+            from pub_scopus_articles_author
+            where AUTHORID in ({placeholders})"""
+        for row in execute_query_with_connection(cursor, scopus_author_data_query, params=scopus_ids, conn=conn):
+            scopus_authors[str(row["AUTHORID"])] = row
+
+        scopus_works_query = f"""select psaa.AUTHORID as AUTHORID, psa.TITLE as title, psa.DOI as doi
+            from pub_scopus_articles_author psaa
+            join pub_scopus_articles psa on psaa.PUBID = psa.PUBID
+            where psaa.AUTHORID in ({placeholders})"""
+        for row in execute_query_with_connection(cursor, scopus_works_query, params=scopus_ids, conn=conn):
+            scopus_works[str(row["AUTHORID"])].append({"title": row["title"], "doi": row["doi"]})
+
+    # Prefetch all IRIS works with one parameterized IN-query grouped by
+    # matricola, so the workers never touch the database
+    iris_table = defaultdict(list)
+    matricolas = tuple({author_item.get("matricola") for author_item in authors
+                        if author_item.get("matricola") is not None})
+    if matricolas:
+        placeholders = ", ".join(["%s"] * len(matricolas))
+        iris_works_query = f"""select prpa.matricola as matricola, prpb.TITOLO as titolo, prpb.cd_doi as doi, prpb.ANNO as anno,
+                                   prpb.HANDLE as HANDLE, prpb.NOME_EDITORE as nome_editore,
+                                   prpb.STRINGA_AUTORI as stringa_autori
+            from pub_ri_prodotti_autori as prpa
+            join pub_ri_prodotti_base as prpb
+            on prpa.ID_PRODOTTO = prpb.ID_PRODOTTO
+            where prpa.matricola in ({placeholders})"""
+        for row in execute_query_with_connection(cursor, iris_works_query, params=matricolas, conn=conn):
+            iris_table[str(row.pop("matricola"))].append(row)
+
+    # Close database connection before forking the workers: each worker only
+    # needs the prefetched tables, never a connection of its own
+    cursor.close()
+    conn.close()
+
+    # Prefetch the OpenAlex record of every distinct IRIS DOI with one
+    # OR-filtered request per 50 DOIs. Co-authored papers appear in every
+    # co-author's work list, so deduplicating the DOIs here fetches each
+    # shared work once instead of once per author
+    unique_dois = sorted({work["doi"].lower() for works in iris_table.values()
+                          for work in works if work.get("doi")})
+    oa_doi_table = {}
+    if unique_dois:
+        print(f"🔎 Prefetching OpenAlex records for {len(unique_dois)} distinct DOIs...")
+        for batch_start in range(0, len(unique_dois), DOI_BATCH_SIZE):
+            dois_batch = unique_dois[batch_start:batch_start + DOI_BATCH_SIZE]
+            works_by_doi_url = f"https://api.openalex.org/works?per-page={len(dois_batch)}&filter=doi:{'|'.join(dois_batch)}"
+            response = SESSION.get(works_by_doi_url)
+            if response.status_code == 200:
+                for work in response.json()['results']:
+                    if work.get("doi"):
+                        oa_doi_table[work["doi"].removeprefix("https://doi.org/").lower()] = work
+
+    # Process all authors
+    print(f"\n")
+    indexed_authors = list(enumerate(authors, 1))
+    initargs = (dict(iris_table), scopus_authors, dict(scopus_works), oa_doi_table, len(authors))
+    if MAX_WORKERS > 1:
+        # Close the parent's session before forking: the DOI prefetch above
+        # left live keep-alive sockets (and, with requests-cache, an open
+        # SQLite handle) in its pool, and fork() would hand copies of those
+        # descriptors to every worker
+        SESSION.close()
+        with ProcessPoolExecutor(max_workers=MAX_WORKERS,
+                                 initializer=_init_worker,
+                                 initargs=initargs) as pool:
+            results_iter = pool.map(process_author, indexed_authors, chunksize=CHUNKSIZE)
+            all_results = [result for result in results_iter if result is not None]
+    else:
+        # Single-core fallback: run sequentially in this process
+        _init_worker(*initargs)
+        all_results = [result for result in map(process_author, indexed_authors)
+                       if result is not None]
+
+    # Save results to JSON file
+    if SAVE_RESULTS_TO_FILE and all_results:
+        results_filename = f"oa_vs_scopus_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        write_json_to_file(all_results, results_filename)
+        print(f"\n📁 Results saved to: {results_filename}")
+
+        # Extract and display statistics
+        extract_statistics(all_results)
+    else:
+        print("\n⚠️  No results to save.")
 
-                print(f"👌 Works match: {scopus_matched_count}/{len(iris_works)} (number of works matching on Scopus / total number of author's works)")
-                if PRINT_NOT_MATCHED_WORKS:
-                    if (scopus_matched_count < len(iris_works)):
-                        print(f"❌ Missing Works (title):")
-                        print(*[missing_work for missing_work in scopus_missing_iris_works], sep='\n')
-            else:
-                print(f"❌ No results found on Scopus")
-        
-        # Calculate works missing only on OpenAlex (present in Scopus but not in OpenAlex)
-        works_missing_only_on_oa = len([missing_work for missing_work in oa_missing_iris_works 
-                                        if missing_work not in scopus_missing_iris_works])
-        print(f"❌ {works_missing_only_on_oa} works missing only on OpenAlex (title):")
-        print(*[missing_work for missing_work in oa_missing_iris_works 
-                if missing_work not in scopus_missing_iris_works], sep='\n')
-        
-        # Store results for this author
-        if SAVE_RESULTS_TO_FILE:
-            author_result = {
-                "matricola": author_employee_id,
-                "nome_autore": author_first_name,
-                "cognome_autore": author_last_name,
-                "cod_fis": author_tax_code,
-                "orcid": author_orcid,
-                "scopus_id": author_scopus_id,
-                "open_alex_id": openalex_author_id_final if openalex_author_id_final else None,
-                "numero_lavori": len(iris_works),
-                "numero_lavori_doi": len(iris_works_with_doi),
-                "oa_numero_lavori": oa_works_count,
-                "oa_match": oa_matched_count,
-                "scopus_numero_lavori": scopus_works_count,
-                "scopus_match": scopus_matched_count,
-                "lavori_mancanti_solo_su_oa": works_missing_only_on_oa,
-                "dt_ins": datetime.today().strftime('%Y-%m-%d')
-            }
-            all_results.append(author_result)
-
-        # Final spacing
-        print(f"\n\n\n")
-
-# Close database connection
-cursor.close()
-conn.close()
-
-# Save results to JSON file
-if SAVE_RESULTS_TO_FILE and all_results:
-    results_filename = f"oa_vs_scopus_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-    write_json_to_file(all_results, results_filename, cursor=None, conn=None)
-    print(f"\n📁 Results saved to: {results_filename}")
-    
-    # Extract and display statistics
-    extract_statistics(all_results)
-else:
-    print("\n⚠️  No results to save.")
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,12 @@ and publication year.
 
 import os
 import sys
-import time
-import json
 import requests
+from requests.adapters import HTTPAdapter, Retry
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import quote_plus
 
 # Add the project root directory to Python path to enable imports from utilities
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -18,282 +20,487 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from utilities.db_utils import test_connection, execute_query_with_connection
-from utilities.file_utils import write_json_to_file, read_json_from_file, parse_author_pairs
+from utilities.http_utils import OPENALEX_RATE_LIMITER, parse_json_response
+from utilities.file_utils import FileUtilError, write_json_to_file, iter_json_from_file, append_jsonl_to_file, parse_author_pairs
 from utilities.sim_lib import similarity_authors
-from utilities.sim_lib import similarity_titles
-from utilities.sim_lib import similarity_years
+from utilities.sim_lib import similarity_titles_one_to_many
+from utilities.sim_lib import similarity_years_batch
 from works_matching.stats_utils import calculate_statistics, print_statistics
 
+# rapidfuzz is optional: its C++ scorer replaces the pure-Python title
+# metric in rank_candidates when installed, as in the coverage script
+try:
+    from rapidfuzz import fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 # Flag to enable/disable saving statistics to JSON file
 PRINT_STATS = True
 
+# If False, print only a one-line progress summary per work instead of the
+# full per-candidate detail (thousands of lines over a full run)
+VERBOSE = True
+
+# Flag to enable/disable writing matched works back to the database
+SAVE_MATCHES_TO_DB = False
+
 # ROR identifier for Politecnico di Torino
 ROR_POLITO = 'https://ror.org/00bgk9508'
 
-# Test database connection and get connection/cursor objects
-conn, cursor = test_connection()
-
-# Query to get all works from IRIS database
-# Returns: HANDLE, TITOLO (title), ANNO (year), STRINGA_AUTORI (authors string),
-# DS_PROPRIETARIO (owner description), MATRICOLA_PROPRIETARIO (owner ID), CD_SCOPUS (Scopus ID), CD_DOI (DOI)
-select_works_IRIS_query = """
-select distinct HANDLE, TITOLO, ANNO, STRINGA_AUTORI, DS_PROPRIETARIO, MATRICOLA_PROPRIETARIO, CD_SCOPUS, CD_DOI
-from pub_ri_prodotti_base
-where anno > 2003 and anno < 2005 and cd_doi is null
-limit 200
-"""
+# Maximum number of DOIs OpenAlex accepts in a single OR-filter
+DOI_BATCH_SIZE = 50
 
-# Execute query to retrieve works from IRIS database
-results = execute_query_with_connection(cursor, select_works_IRIS_query, conn=conn)
+# Thread-pool size for the per-work loop: the workload is I/O bound (HTTP
+# round trips with the GIL released during socket reads), so threads
+# overlap the waits; the session pool above is sized to accommodate them
+# and OPENALEX_RATE_LIMITER caps the aggregate request rate
+MAX_WORKERS = 16
 
-# Output file to store query results
-output_file = "names_from_IRIS.txt"
+# The only Works fields the matching below consumes; asking OpenAlex to
+# select just these cuts the JSON transferred and parsed per response by
+# an order of magnitude (full records carry abstracts, concepts, locations)
+FIELDS = "id,display_name,type,publication_year,authorships"
 
-# Write query results to JSON file for processing
-write_json_to_file(results, output_file, cursor=cursor, conn=conn)
+# URL templates composed once at import with the fixed parts (selected
+# fields, page size) baked in; the loop only fills in the encoded title or
+# DOI batch. doi is added to the prefetch template's fields because the
+# prefetched records are indexed by it.
+URL_DOI_FMT = "https://api.openalex.org/works?per-page={n}&select=" + FIELDS + ",doi&filter=doi:{dois}"
+URL_T_FMT = "https://api.openalex.org/works?search={t}&per-page=25&select=" + FIELDS
 
-# Read the JSON file containing works data
-data = read_json_from_file(output_file, cursor=cursor, conn=conn) 
+# HTTP session shared by every OpenAlex call in this script: the pooled
+# adapter reuses TCP+TLS connections across works instead of handshaking
+# per request, and retries transient failures with backoff. When
+# requests-cache is installed the responses also persist on disk with a
+# TTL, so re-runs over the same titles (debugging, tuning the similarity
+# weights) answer from SQLite in microseconds instead of the network.
+# Mirrors the setup in the other matching scripts.
+try:
+    from datetime import timedelta
+    from requests_cache import CachedSession
+    SESSION = CachedSession('openalex_works_cache.sqlite', backend='sqlite',
+                            allowable_codes=[200],
+                            expire_after=timedelta(days=7))
+except ImportError:
+    SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=5, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504])
+))
+# Identify the client per OpenAlex polite-pool rules (faster request tier)
+SESSION.headers['User-Agent'] = 'polito_FAIR_project (mailto:fedra-project@polito.it)'
 
-# Counter for processed works
-count = 0
+# Total number of works being processed, set in main() and read by
+# process_work() for the [count/total] progress output
+total_works = 0
 
-# List to store statistics for each work (if PRINT_STATS is True)
-stats_data = []
+# OpenAlex works indexed by lowercased DOI, batch-prefetched in main() so
+# the DOI phase is a dict lookup instead of one GET per work
+oa_work_by_doi = {}
 
-# Process each work from the IRIS database
-for item in data:
-        count += 1
 
-        # Process all works (condition can be modified to filter specific ranges)
-        if count > 0:
-                # Extract work metadata from IRIS database record
-                handle = item.get("HANDLE")
-                titolo = item.get("TITOLO")  # Title
-                anno = item.get("ANNO")  # Publication year
-                stringa_autori = item.get("STRINGA_AUTORI")  # Authors string
-                ds_proprietario = item.get("DS_PROPRIETARIO")  # Owner description
-                matricola_proprietario = item.get("MATRICOLA_PROPRIETARIO")  # Owner ID
-                cd_scopus = item.get("CD_SCOPUS")  # Scopus ID
-                doi = item.get("CD_DOI")  # DOI
-                authors = parse_author_pairs(stringa_autori)
+def rank_candidates(titolo, authors, anno, work_results):
+        """
+        Score every OpenAlex candidate against one IRIS work.
 
-                print(f"Handle: {handle}")
-                print(f"Title: {titolo}")
-                print(f"Year: {anno}")
-                print(f"DOI: {doi}")
-                print(f"Authors: {authors}")
+        The title and year metrics go through the one-to-many sim_lib
+        variants, so the IRIS side is validated and encoded once for the
+        whole candidate set; author similarity stays per candidate. Scores
+        combine with the usual 0.5/0.25/0.25 weights.
 
-                # Initialize statistics entry for this work (if PRINT_STATS is enabled)
-                if PRINT_STATS:
-                        work_stats = {
-                                "handle": handle,
-                                "title": titolo,
-                                "year": anno,
-                                "authors": authors,
-                                "doi": doi,
-                                "scopus_id": cd_scopus,
-                                "matched": False,
-                                "match_found": False,
-                                "similarity_score": None,
-                                "openalex_id": None,
-                                "openalex_title": None,
-                                "openalex_authors": None,
-                                "openalex_year": None,
-                                "search_method": None
-                        }
-        
-                try:
-                        work_results = []
-                        search_successful = False
-                        
-                        # If DOI is present, search OpenAlex by DOI first
-                        if doi:
-                                print(f"🔍 [{count}/{len(data)}] Searching by DOI...")
-                                
-                                # Search OpenAlex using DOI filter
-                                url = f"https://api.openalex.org/works?filter=doi:{doi}"
-                                response = requests.get(url)
-                                
-                                if response.status_code == 200 and response.json().get("meta", {}).get("count", 0) >= 1:
-                                        work_results = response.json().get('results', [])
-                                        search_successful = True
-                                        print(f"✅ Found {len(work_results)} work(s) by DOI")
-                                        if PRINT_STATS:
-                                                work_stats["search_method"] = "DOI"
+        Args:
+            titolo: IRIS work title
+            authors: List of (surname, name) pairs parsed from IRIS
+            anno: IRIS publication year
+            work_results: List of OpenAlex work records
+
+        Returns:
+            Tuple (scores, authors_lists, best_index): the combined score and
+            author display names per candidate, and the index of the best one
+        """
+        cand_titles = [work.get('display_name', '') for work in work_results]
+        cand_years = [work.get('publication_year') for work in work_results]
+        if RAPIDFUZZ_AVAILABLE and isinstance(titolo, str):
+                # One C-level bit-parallel scorer call per candidate, scaled
+                # from rapidfuzz's 0-100 range to the 0-1 range the weights
+                # below expect
+                titles_scores = [fuzz.token_sort_ratio(titolo, cand) / 100.0 for cand in cand_titles]
+        else:
+                titles_scores = similarity_titles_one_to_many(titolo, cand_titles)
+        years_scores = similarity_years_batch(anno, cand_years)
+        # Author display names extracted once per candidate and reused by the
+        # caller for printing and for the selected best match
+        authors_lists = [[a.get("author", {}).get("display_name", "N/A") for a in work.get("authorships", [])]
+                         for work in work_results]
+
+        scores = []
+        best_index = 0
+        best_score = -1.0
+        for i, authors_OA in enumerate(authors_lists):
+                similarity_score = titles_scores[i]*0.5 + similarity_authors(authors, authors_OA)*0.25 + years_scores[i]*0.25
+                scores.append(similarity_score)
+                if similarity_score > best_score:
+                        best_score = similarity_score
+                        best_index = i
+        return scores, authors_lists, best_index
+
+
+def process_work(indexed_item):
+        """
+        Match one IRIS work against OpenAlex.
+
+        Runs the DOI search first and falls back to the title/institution/year
+        chain, then scores the candidates with the sim_lib metrics.
+
+        Args:
+            indexed_item: Tuple of (1-based progress index, IRIS work dict)
+
+        Returns:
+            Statistics dict for the work when PRINT_STATS is True, otherwise None
+        """
+        count, item = indexed_item
+        out = []  # Buffered output for this work, flushed in one print per return path
+
+        # Extract work metadata from IRIS database record
+        handle = item.get("HANDLE")
+        titolo = item.get("TITOLO")  # Title
+        anno = item.get("ANNO")  # Publication year
+        stringa_autori = item.get("STRINGA_AUTORI")  # Authors string
+        ds_proprietario = item.get("DS_PROPRIETARIO")  # Owner description
+        matricola_proprietario = item.get("MATRICOLA_PROPRIETARIO")  # Owner ID
+        cd_scopus = item.get("CD_SCOPUS")  # Scopus ID
+        doi = item.get("CD_DOI")  # DOI
+        authors = parse_author_pairs(stringa_autori)
+        # URL-encode the title once; every fallback attempt reuses the same
+        # encoded form instead of re-encoding (and encoding inconsistently)
+        # per request
+        titolo_enc = quote_plus(titolo or "")
+
+        out.append(f"Handle: {handle}")
+        out.append(f"Title: {titolo}")
+        out.append(f"Year: {anno}")
+        out.append(f"DOI: {doi}")
+        out.append(f"Authors: {authors}")
+
+        # Initialize statistics entry for this work (if PRINT_STATS is enabled)
+        work_stats = None
+        if PRINT_STATS:
+                work_stats = {
+                        "handle": handle,
+                        "title": titolo,
+                        "year": anno,
+                        "authors": authors,
+                        "doi": doi,
+                        "scopus_id": cd_scopus,
+                        "matched": False,
+                        "match_found": False,
+                        "similarity_score": None,
+                        "openalex_id": None,
+                        "openalex_title": None,
+                        "openalex_authors": None,
+                        "openalex_year": None,
+                        "search_method": None
+                }
+
+        try:
+                work_results = []
+                search_successful = False
+
+                # If DOI is present, search OpenAlex by DOI first
+                if doi:
+                        out.append(f"🔍 [{count}/{total_works}] Searching by DOI...")
+
+                        # Look up the DOI in the table batch-prefetched in
+                        # main() instead of issuing one GET per work
+                        oa_work = oa_work_by_doi.get(doi.lower())
+                        if oa_work is not None:
+                                work_results = [oa_work]
+                                search_successful = True
+                                out.append(f"✅ Found {len(work_results)} work(s) by DOI")
+                                if PRINT_STATS:
+                                        work_stats["search_method"] = "DOI"
+                        else:
+                                out.append(f"⚠️  No match found by DOI, falling back to title/institution/year search")
+
+                # If no DOI or DOI search failed, search by title and filter
+                # the institution/year constraints locally
+                if not search_successful:
+                        out.append(f"🔍 [{count}/{total_works}] Searching by title...")
+
+                        # One general search returns a superset of what the old
+                        # three progressively looser queries found, so the
+                        # worst case costs one round trip instead of three;
+                        # the Polito-ROR and year constraints are applied to
+                        # the candidates locally below. The body is decoded
+                        # exactly once (with orjson when installed).
+                        url = URL_T_FMT.format(t=titolo_enc)
+                        OPENALEX_RATE_LIMITER.acquire()
+                        response = SESSION.get(url, timeout=10)
+                        payload = parse_json_response(response) if response.status_code == 200 else {}
+
+                        if payload.get("meta", {}).get("count", 0) < 1:
+                                if response.status_code != 200:
+                                        # Fall through to the zero-results path below
+                                        out.append(f"❌ API Error")
                                 else:
-                                        print(f"⚠️  No match found by DOI, falling back to title/institution/year search")
-                        
-                        # If no DOI or DOI search failed, search by title, institution, and year
-                        if not search_successful:
-                                print(f"🔍 [{count}/{len(data)}] Searching by title/institution/year...")
-
-                                # First attempt: Search OpenAlex using title.search filter
-                                # Filters by: title search, Politecnico di Torino institution, publication year
-                                url = f"https://api.openalex.org/works?filter=title.search:{titolo},institutions.ror:{ROR_POLITO},publication_year:{anno}"
-                                response = requests.get(url) 
-
-                                # If first attempt fails or returns no results, try general search
-                                if response.status_code != 200 or response.json().get("meta", {}).get("count", 0) < 1:
-                                        
-                                        # Second attempt: Use general search instead of title.search filter
-                                        url = f"https://api.openalex.org/works?search={titolo}&filter=institutions.ror:{ROR_POLITO},publication_year:{anno}"
-                                        response = requests.get(url) 
-                                        
-                                        # If second attempt also fails, try general search without filters
-                                        if response.status_code != 200 or response.json().get("meta", {}).get("count", 0) < 1:
-                                                
-                                                # Third attempt: General search without any filters
-                                                print(f"🔍 [{count}/{len(data)}] Searching by title only (no filters)...")
-                                                url = f"https://api.openalex.org/works?search={titolo}"
-                                                response = requests.get(url)
-                                                
-                                                # If third attempt also fails, log error and skip to next work
-                                                if response.status_code != 200 or response.json().get("meta", {}).get("count", 0) < 1:
-                                                        if response.status_code != 200:
-                                                                print(f"❌ API Error")
-                                                elif response.json().get("meta", {}).get("count", 0) < 1:
-                                                        print(f"⚠️  No match found")
-                                                        print("─" * 80)
-                                                        print()
-                                                        # Update statistics for no match (if PRINT_STATS is enabled)
-                                                        if PRINT_STATS:
-                                                                work_stats["matched"] = False
-                                                                work_stats["match_found"] = False
-                                                                work_stats["search_method"] = "title_only"
-                                                                stats_data.append(work_stats)
-                                                        continue
-                                                else:
-                                                        work_results = response.json().get('results', [])
-                                                        print(f"✅ Found {len(work_results)} work(s) by title only")
-                                                        if PRINT_STATS:
-                                                                work_stats["search_method"] = "title_only"
+                                        out.append(f"⚠️  No match found")
+                                        out.append("─" * 80)
+                                        out.append("")
+                                        # Update statistics for no match (if PRINT_STATS is enabled)
+                                        if PRINT_STATS:
+                                                work_stats["matched"] = False
+                                                work_stats["match_found"] = False
+                                                work_stats["search_method"] = "title_only"
+                                        if VERBOSE:
+                                                print("\n".join(out))
                                         else:
-                                                # Extract work results from OpenAlex API response (second attempt succeeded)
-                                                work_results = response.json().get('results', [])
-                                                print(f"✅ Found {len(work_results)} work(s) by title/institution/year")
-                                                if PRINT_STATS:
-                                                        work_stats["search_method"] = "title_institution_year_general"
-                                else:
-                                        # Extract work results from OpenAlex API response (first attempt succeeded)
-                                        work_results = response.json().get('results', [])
-                                        print(f"✅ Found {len(work_results)} work(s) by title/institution/year")
+                                                print(f"[{count}/{total_works}] {handle} — no match")
+                                        return work_stats
+                        else:
+                                all_candidates = payload.get('results', [])
+                                # Prefer candidates that also carry the Polito
+                                # ROR and the IRIS publication year — the same
+                                # constraints the old tightest query expressed
+                                # as API filters
+                                filtered = [work for work in all_candidates
+                                            if work.get('publication_year') == anno
+                                            and any(inst.get('ror') == ROR_POLITO
+                                                    for authorship in work.get('authorships', [])
+                                                    for inst in authorship.get('institutions', []))]
+                                if filtered:
+                                        work_results = filtered
+                                        out.append(f"✅ Found {len(work_results)} work(s) by title/institution/year")
                                         if PRINT_STATS:
                                                 work_stats["search_method"] = "title_institution_year_filter"
-                        
-                        # Process each matched work from OpenAlex
-                        if len(work_results) == 0:
-                                # No results found (shouldn't happen due to checks above, but handle just in case)
-                                if PRINT_STATS:
-                                        work_stats["matched"] = False
-                                        work_stats["match_found"] = False
-                                        stats_data.append(work_stats)
-                                continue
-                        elif len(work_results) > 1:
-                                print(f"📚 Multiple works found ({len(work_results)}) - Evaluating similarity...")
-                                results_count = 0
-                                best_score = -1
-                                best_OA_ID = None
-                                best_OA_display_name = None
-                                best_OA_authors = None
-                                best_OA_year = None
-                                best_OA_cited_by_count = None
-                                best_OA_created_date = None
-                                
-                                for work in work_results:
-                                        results_count += 1
-                                        print(f"\n   📄 Work #{results_count}/{len(work_results)}:")
-                                        print(f"      Title: {work.get('display_name', 'N/A')}")
-                                        print(f"      ID: {work.get('id', 'N/A')}")
-                                        print(f"      Type: {work.get('type', 'N/A')}")
-                                        authors_OA = [a.get("author", {}).get("display_name", "N/A") for a in work.get("authorships", [])]
-                                        print(f"      Authors: {authors_OA}")
-
-                                        # Calculate similarity between titles, authors, and years
-                                        work_display_name = work.get('display_name', '')
-                                        titles_similarity = similarity_titles(titolo, work_display_name)
-                                        authors_similarity = similarity_authors(authors, authors_OA)
-                                        years_similarity = similarity_years(anno, work.get('publication_year'))
-
-                                        similarity_score = titles_similarity*0.5 + authors_similarity*0.25 + years_similarity*0.25
-                                        print(f"      📊 Similarity score: {similarity_score:.3f}")
-
-                                        if similarity_score > best_score:
-                                                best_score = similarity_score      
-                                                best_OA_ID = work.get('id')
-                                                best_OA_display_name = work.get('display_name')
-                                                best_OA_authors = [a.get("author", {}).get("display_name", "N/A") for a in work.get("authorships", [])]
-                                                best_OA_year = work.get('publication_year')
-                                print(f"\n   🏆 Best match selected:")
-                                print(f"      Title: {best_OA_display_name}")
-                                print(f"      ID: {best_OA_ID}")
-                                print(f"      Authors: {best_OA_authors}")
-                                
-                                # Update statistics with best match (if PRINT_STATS is enabled)
-                                if PRINT_STATS:
-                                        work_stats["matched"] = True
-                                        work_stats["match_found"] = True
-                                        work_stats["similarity_score"] = best_score
-                                        work_stats["openalex_id"] = best_OA_ID
-                                        work_stats["openalex_title"] = best_OA_display_name
-                                        work_stats["openalex_authors"] = best_OA_authors
-                                        work_stats["openalex_year"] = best_OA_year
+                                else:
+                                        work_results = all_candidates
+                                        out.append(f"✅ Found {len(work_results)} work(s) by title only")
+                                        if PRINT_STATS:
+                                                work_stats["search_method"] = "title_only"
+
+                # Process each matched work from OpenAlex
+                if len(work_results) == 0:
+                        # No results found (shouldn't happen due to checks above, but handle just in case)
+                        if PRINT_STATS:
+                                work_stats["matched"] = False
+                                work_stats["match_found"] = False
+                        if VERBOSE:
+                                print("\n".join(out))
                         else:
-                                print(f"✨ Single work found:")
-                                print(f"   Title: {work_results[0].get('display_name', 'N/A')}")
-                                print(f"   ID: {work_results[0].get('id', 'N/A')}")
-                                authors_OA = [a.get("author", {}).get("display_name", "N/A") for a in work_results[0].get("authorships", [])]
-                                print(f"   Authors: {authors_OA}")
-                                # calculating similarity score
-                                work_display_name = work_results[0].get('display_name', '')
-                                titles_similarity = similarity_titles(titolo, work_display_name)
-                                authors_similarity = similarity_authors(authors, authors_OA)
-                                years_similarity = similarity_years(anno, work_results[0].get('publication_year'))
-                                similarity_score = titles_similarity*0.5 + authors_similarity*0.25 + years_similarity*0.25
-                                print(f"      Similarity score: {similarity_score:.3f}")
-                                
-                                # Update statistics with single match (if PRINT_STATS is enabled)
-                                if PRINT_STATS:
-                                        work_stats["matched"] = True
-                                        work_stats["match_found"] = True
-                                        work_stats["similarity_score"] = similarity_score
-                                        work_stats["openalex_id"] = work_results[0].get('id')
-                                        work_stats["openalex_title"] = work_results[0].get('display_name')
-                                        work_stats["openalex_authors"] = authors_OA
-                                        work_stats["openalex_year"] = work_results[0].get('publication_year')
-                        
-                        # Add statistics entry to list (if PRINT_STATS is enabled)
+                                print(f"[{count}/{total_works}] {handle} — no results")
+                        return work_stats
+                elif len(work_results) > 1:
+                        out.append(f"📚 Multiple works found ({len(work_results)}) - Evaluating similarity...")
+
+                        # Score all candidates in one pass over the batch
+                        scores, authors_lists, best_index = rank_candidates(titolo, authors, anno, work_results)
+
+                        for i, work in enumerate(work_results):
+                                out.append(f"\n   📄 Work #{i + 1}/{len(work_results)}:")
+                                out.append(f"      Title: {work.get('display_name', 'N/A')}")
+                                out.append(f"      ID: {work.get('id', 'N/A')}")
+                                out.append(f"      Type: {work.get('type', 'N/A')}")
+                                out.append(f"      Authors: {authors_lists[i]}")
+                                out.append(f"      📊 Similarity score: {scores[i]:.3f}")
+
+                        best_work = work_results[best_index]
+                        out.append(f"\n   🏆 Best match selected:")
+                        out.append(f"      Title: {best_work.get('display_name')}")
+                        out.append(f"      ID: {best_work.get('id')}")
+                        out.append(f"      Authors: {authors_lists[best_index]}")
+
+                        # Update statistics with best match (if PRINT_STATS is enabled)
                         if PRINT_STATS:
-                                stats_data.append(work_stats)
-
-                except Exception as e:
-                        # If API or other error occurs, exit program
-                        print(f"💥 FATAL ERROR: {e}")
-                        print(f"   Work: #{count}/{len(work_results)} - {handle} - {titolo} - {anno}")
-                        exit(1)
-
-                # Delay between processing different works to avoid overwhelming the API
-                print("─" * 80)
-                time.sleep(0.1)
-
-# Close database connection and cursor
-cursor.close()
-conn.close()
-
-# Calculate and display statistics if PRINT_STATS is enabled
-if PRINT_STATS:
-        # Calculate comprehensive statistics
-        print("\nCalculating statistics...")
-        stats = calculate_statistics(stats_data)
-        
-        # Print statistics in readable format
-        print_statistics(stats)
-        
-        # Save calculated matching statistics to JSON file
-        stats_filename = f"matching_stats_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        try:
-                with open(stats_filename, 'w', encoding='utf-8') as f:
-                        json.dump(stats, f, indent=2, ensure_ascii=False)
-                print(f"\n📊 Matching statistics saved to: {stats_filename}")
+                                work_stats["matched"] = True
+                                work_stats["match_found"] = True
+                                work_stats["similarity_score"] = scores[best_index]
+                                work_stats["openalex_id"] = best_work.get('id')
+                                work_stats["openalex_title"] = best_work.get('display_name')
+                                work_stats["openalex_authors"] = authors_lists[best_index]
+                                work_stats["openalex_year"] = best_work.get('publication_year')
+                else:
+                        out.append(f"✨ Single work found:")
+                        out.append(f"   Title: {work_results[0].get('display_name', 'N/A')}")
+                        out.append(f"   ID: {work_results[0].get('id', 'N/A')}")
+                        # calculating similarity score through the same ranking
+                        # helper as the multi-result branch
+                        scores, authors_lists, _ = rank_candidates(titolo, authors, anno, work_results)
+                        out.append(f"   Authors: {authors_lists[0]}")
+                        out.append(f"      Similarity score: {scores[0]:.3f}")
+
+                        # Update statistics with single match (if PRINT_STATS is enabled)
+                        if PRINT_STATS:
+                                work_stats["matched"] = True
+                                work_stats["match_found"] = True
+                                work_stats["similarity_score"] = scores[0]
+                                work_stats["openalex_id"] = work_results[0].get('id')
+                                work_stats["openalex_title"] = work_results[0].get('display_name')
+                                work_stats["openalex_authors"] = authors_lists[0]
+                                work_stats["openalex_year"] = work_results[0].get('publication_year')
+
         except Exception as e:
-                print(f"⚠️  Error saving statistics: {e}")
+                # Transient HTTP failures are already retried with backoff by
+                # the session adapter; whatever still gets here is recorded on
+                # this work's stats entry so one bad row no longer throws away
+                # the whole batch with exit(1)
+                out.append(f"💥 ERROR: {e}")
+                out.append(f"   Work: #{count}/{total_works} - {handle} - {titolo} - {anno}")
+                print("\n".join(out))
+                if PRINT_STATS:
+                        work_stats["error"] = str(e)
+                return work_stats
+
+        # Rate limiting is handled per request by OPENALEX_RATE_LIMITER, so
+        # no extra delay between works is needed. Buffered output goes out in
+        # one print so concurrent workers do not interleave lines; with
+        # VERBOSE off, only a one-line summary is written per work.
+        if VERBOSE:
+                out.append("─" * 80)
+                print("\n".join(out))
+        else:
+                print(f"[{count}/{total_works}] {handle} — matched ({len(work_results)} candidate(s))")
+        return work_stats
+
+
+def main():
+        global total_works
+
+        # Test database connection and get connection/cursor objects
+        conn, cursor = test_connection()
+
+        # Query to get all works from IRIS database
+        # Returns: HANDLE, TITOLO (title), ANNO (year), STRINGA_AUTORI (authors string),
+        # DS_PROPRIETARIO (owner description), MATRICOLA_PROPRIETARIO (owner ID), CD_SCOPUS (Scopus ID), CD_DOI (DOI)
+        select_works_IRIS_query = """
+        select distinct HANDLE, TITOLO, ANNO, STRINGA_AUTORI, DS_PROPRIETARIO, MATRICOLA_PROPRIETARIO, CD_SCOPUS, CD_DOI
+        from pub_ri_prodotti_base
+        where anno > 2003 and anno < 2005 and cd_doi is null
+        limit 200
+        """
+
+        # Execute query to retrieve works from IRIS database
+        results = execute_query_with_connection(cursor, select_works_IRIS_query, conn=conn)
+
+        # Output file to store query results
+        output_file = "names_from_IRIS.txt"
+
+        # Write query results to JSON file for processing; on failure close
+        # the DB resources here (file_utils raises instead of exiting so
+        # callers own their cleanup)
+        try:
+                write_json_to_file(results, output_file)
+        except FileUtilError as e:
+                print(e)
+                cursor.close()
+                conn.close()
+                exit(1)
+
+        # Total and DOI set come from the rows already fetched; the main loop
+        # below re-reads the file as a stream (one row resident at a time
+        # with ijson installed) so full-table runs are not bounded by the
+        # size of the round-tripped JSON
+        total_works = len(results)
+        dois = sorted({item["CD_DOI"].lower() for item in results if item.get("CD_DOI")})
+        del results
+
+        # Batch-prefetch the OpenAlex record of every DOI in the batch with
+        # one OR-filtered request per 50 DOIs, indexed by lowercased DOI
+        if dois:
+                print(f"🔎 Prefetching OpenAlex records for {len(dois)} DOIs...")
+                for batch_start in range(0, len(dois), DOI_BATCH_SIZE):
+                        dois_batch = dois[batch_start:batch_start + DOI_BATCH_SIZE]
+                        url = URL_DOI_FMT.format(n=len(dois_batch), dois='|'.join(dois_batch))
+                        OPENALEX_RATE_LIMITER.acquire()
+                        response = SESSION.get(url, timeout=10)
+                        if response.status_code == 200:
+                                for work in parse_json_response(response).get('results', []):
+                                        if work.get("doi"):
+                                                oa_work_by_doi[work["doi"].removeprefix("https://doi.org/").lower()] = work
+
+        # List to store statistics for each work (if PRINT_STATS is True)
+        stats_data = []
+
+        # Per-work results are also appended to a JSON Lines file as they
+        # complete, so an interrupted run keeps everything processed so far
+        # instead of losing the whole batch with the in-memory list
+        results_filename = f"matching_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+
+        # Collect one finished work: record the result and append it to the
+        # JSONL file so an interrupted run keeps everything processed so far
+        def collect_result(future):
+                work_stats = future.result()
+                if work_stats is not None:
+                        stats_data.append(work_stats)
+                        try:
+                                append_jsonl_to_file(work_stats, results_filename)
+                        except FileUtilError as e:
+                                print(f"⚠️  {e}")
+
+        # Process each work from the IRIS database, streamed from the file;
+        # the thread pool overlaps the blocking OpenAlex round trips while
+        # the shared rate limiter keeps the aggregate request rate in policy.
+        # Executor.map would pull the whole generator into pending futures up
+        # front, so the works are submitted through a bounded sliding window
+        # instead: at most 2*MAX_WORKERS rows are in flight and the oldest
+        # future is drained before the next row is read, which keeps the
+        # ijson stream lazy (one row resident at a time) so full-table runs
+        # are not bounded by the size of the round-tripped JSON
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+                pending = deque()
+                for indexed_item in enumerate(iter_json_from_file(output_file), 1):
+                        pending.append(pool.submit(process_work, indexed_item))
+                        if len(pending) >= 2 * MAX_WORKERS:
+                                collect_result(pending.popleft())
+                while pending:
+                        collect_result(pending.popleft())
+
+        if stats_data:
+                print(f"\n📁 Per-work results saved to: {results_filename}")
+
+        # Write the matches back in one bulk insert (a single round trip for
+        # the whole batch instead of one insert per work) before closing
+        if SAVE_MATCHES_TO_DB and stats_data:
+                insert_rows = [(s["handle"], s["openalex_id"], s["similarity_score"],
+                                datetime.today().strftime('%Y-%m-%d'))
+                               for s in stats_data if s["matched"]]
+                if insert_rows:
+                        insert_matches_query = """insert into pub_oa_works_matches (HANDLE, OPENALEX_ID, SIMILARITY_SCORE, DT_INS)
+                        values (%s, %s, %s, %s)"""
+                        try:
+                                cursor.executemany(insert_matches_query, insert_rows)
+                                conn.commit()
+                                print(f"💾 Inserted {len(insert_rows)} matches into pub_oa_works_matches")
+                        except Exception as e:
+                                # The JSONL file already holds the results, so a failed
+                                # insert warns instead of aborting the run
+                                print(f"⚠️  Errore nell'inserimento dei match: {e}")
+
+        # Close database connection and cursor
+        cursor.close()
+        conn.close()
+
+        # Calculate and display statistics if PRINT_STATS is enabled
+        if PRINT_STATS:
+                # Calculate comprehensive statistics
+                print("\nCalculating statistics...")
+                stats = calculate_statistics(stats_data)
+
+                # Print statistics in readable format
+                print_statistics(stats)
+
+                # Save calculated matching statistics to JSON file; the
+                # helper encodes straight to bytes with orjson when installed
+                # instead of the slow stdlib indent+ensure_ascii=False path
+                stats_filename = f"matching_stats_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+                try:
+                        write_json_to_file(stats, stats_filename, indent=2)
+                        print(f"\n📊 Matching statistics saved to: {stats_filename}")
+                except FileUtilError as e:
+                        print(f"⚠️  Error saving statistics: {e}")
+
+
+if __name__ == "__main__":
+        main()